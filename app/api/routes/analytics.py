@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, extract, tuple_
 from datetime import datetime, timedelta
 from app.api.deps import get_db
 from app.models.invoice import Invoice
@@ -61,6 +61,71 @@ def get_top_vendors(limit: int = 10, db: Session = Depends(get_db)):
     }
 
 
+@router.get("/analytics/rollups")
+def get_rollups(db: Session = Depends(get_db)):
+    """
+    Get spending rollups by category, recurring flag, and purchaser.
+
+    Computed in one GROUPING SETS pass over invoices so the dashboard
+    doesn't have to fetch every row and run the groupbys client-side.
+    """
+    rows = (
+        db.query(
+            Invoice.category,
+            Invoice.is_recurring,
+            Invoice.purchaser,
+            func.sum(Invoice.total_amount).label('total_spent'),
+            func.count(Invoice.id).label('invoice_count'),
+            # GROUPING() flags tell us which set each row belongs to,
+            # since non-grouped columns come back NULL
+            func.grouping(Invoice.category).label('g_category'),
+            func.grouping(Invoice.is_recurring).label('g_recurring'),
+        )
+        .group_by(
+            func.grouping_sets(
+                tuple_(Invoice.category),
+                tuple_(Invoice.is_recurring),
+                tuple_(Invoice.purchaser),
+            )
+        )
+        .all()
+    )
+
+    by_category = []
+    by_recurring = []
+    by_purchaser = []
+
+    for row in rows:
+        total_spent = float(row.total_spent or 0)
+        if not row.g_category:
+            by_category.append({
+                "category": row.category,
+                "total_spent": total_spent,
+                "invoice_count": row.invoice_count
+            })
+        elif not row.g_recurring:
+            by_recurring.append({
+                "is_recurring": bool(row.is_recurring),
+                "total_spent": total_spent,
+                "invoice_count": row.invoice_count
+            })
+        elif row.purchaser:
+            by_purchaser.append({
+                "purchaser": row.purchaser,
+                "total_spent": total_spent,
+                "invoice_count": row.invoice_count
+            })
+
+    by_category.sort(key=lambda r: r["total_spent"], reverse=True)
+    by_purchaser.sort(key=lambda r: r["total_spent"], reverse=True)
+
+    return {
+        "by_category": by_category,
+        "by_recurring": by_recurring,
+        "by_purchaser": by_purchaser
+    }
+
+
 @router.get("/analytics/summary")
 def get_summary(db: Session = Depends(get_db)):
     """Get overall analytics summary."""
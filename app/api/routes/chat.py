@@ -1,4 +1,7 @@
+import json
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from app.api.deps import get_db
@@ -58,6 +61,49 @@ async def chat_query(
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_query_stream(
+    request: ChatRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Stream the chat response as server-sent events.
+
+    Emits {"delta": ...} events as tokens arrive and a final {"done": ...}
+    payload matching the /chat response shape. The conversation is saved
+    once the full response is assembled.
+    """
+    # Import here to avoid circular imports
+    from app.services.near_ai import NearAIService
+
+    near_ai = NearAIService()
+    context = await near_ai.build_context(db, request.query)
+
+    async def event_stream():
+        try:
+            async for kind, payload in near_ai.chat_stream(request.query, context):
+                if kind == "delta":
+                    yield f"data: {json.dumps({'delta': payload})}\n\n"
+                    continue
+
+                # Save conversation once the full response is assembled
+                conversation = Conversation(
+                    query=request.query,
+                    response=payload["response"],
+                    model_used=payload["model"],
+                    completion_id=payload["completion_id"]
+                )
+                db.add(conversation)
+                db.commit()
+
+                payload["conversation_id"] = str(conversation.id)
+                yield f"data: {json.dumps({'done': payload})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Chat error: {str(e)}'})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/chat/history")
 def get_chat_history(
     limit: int = 50,
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import func, or_
+from typing import List, Optional
 from app.api.deps import get_db
 from app.models.invoice import Invoice, LineItem
 from app.services.embeddings import generate_embedding
@@ -15,33 +15,69 @@ logger = get_logger(__name__)
 def get_invoices(
     skip: int = 0,
     limit: int = 100,
+    search: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get list of all invoices."""
-    invoices = db.query(Invoice).offset(skip).limit(limit).all()
+    """
+    Get list of invoices, optionally filtered by a search term.
+
+    The search matches vendor, invoice number, category, and purchaser
+    case-insensitively, so clients only transfer matching rows.
+    """
+    query = db.query(Invoice)
+
+    if search:
+        pattern = f"%{search}%"
+        query = query.filter(or_(
+            Invoice.vendor_name.ilike(pattern),
+            Invoice.vendor_normalized.ilike(pattern),
+            Invoice.invoice_number.ilike(pattern),
+            Invoice.category.ilike(pattern),
+            Invoice.purchaser.ilike(pattern),
+        ))
+
+    total = query.count()
+    invoices = query.offset(skip).limit(limit).all()
 
     return {
-        "invoices": [
-            {
-                "id": str(inv.id),
-                "vendor_name": inv.vendor_name,
-                "vendor_normalized": inv.vendor_normalized,
-                "invoice_number": inv.invoice_number,
-                "date": inv.date.isoformat() if inv.date else None,
-                "total_amount": float(inv.total_amount),
-                "category": inv.category,
-                "purchaser": inv.purchaser,
-                "is_recurring": inv.is_recurring,
-                "confidence_score": inv.confidence_score,
-                "parser_used": inv.parser_used,
-                "parsed_at": inv.parsed_at.isoformat() if inv.parsed_at else None,
-            }
-            for inv in invoices
-        ],
-        "total": db.query(Invoice).count()
+        "invoices": [_invoice_summary(inv) for inv in invoices],
+        "total": total
     }
 
 
+def _invoice_summary(inv: Invoice) -> dict:
+    """Serialize an invoice into the summary response shape."""
+    return {
+        "id": str(inv.id),
+        "vendor_name": inv.vendor_name,
+        "vendor_normalized": inv.vendor_normalized,
+        "invoice_number": inv.invoice_number,
+        "date": inv.date.isoformat() if inv.date else None,
+        "total_amount": float(inv.total_amount),
+        "category": inv.category,
+        "purchaser": inv.purchaser,
+        "is_recurring": inv.is_recurring,
+        "confidence_score": inv.confidence_score,
+        "parser_used": inv.parser_used,
+        "parsed_at": inv.parsed_at.isoformat() if inv.parsed_at else None,
+    }
+
+
+@router.get("/invoices/by-hash/{pdf_hash}")
+def get_invoice_by_hash(pdf_hash: str, db: Session = Depends(get_db)):
+    """
+    Look up an invoice by the SHA-256 hash of its source PDF.
+
+    Lets clients skip re-uploading a file that has already been parsed.
+    """
+    invoice = db.query(Invoice).filter(Invoice.pdf_hash == pdf_hash).first()
+
+    if not invoice:
+        raise HTTPException(status_code=404, detail="No invoice found for this file hash")
+
+    return _invoice_summary(invoice)
+
+
 @router.get("/invoices/{invoice_id}")
 def get_invoice(invoice_id: str, db: Session = Depends(get_db)):
     """Get detailed invoice with line items."""
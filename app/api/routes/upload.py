@@ -1,6 +1,10 @@
 import os
+import asyncio
 import hashlib
+import json
+from typing import List
 from fastapi import APIRouter, UploadFile, File, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.models.job import ProcessingJob
@@ -168,14 +172,8 @@ async def upload_invoice(
     }
 
 
-@router.get("/status/{job_id}")
-def get_job_status(job_id: str, db: Session = Depends(get_db)):
-    """Get processing job status and result."""
-    job = db.query(ProcessingJob).filter(ProcessingJob.job_id == job_id).first()
-
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
+def _job_status_response(job: ProcessingJob) -> dict:
+    """Serialize a ProcessingJob into the status response shape."""
     response = {
         "job_id": str(job.job_id),
         "status": job.status,
@@ -189,3 +187,73 @@ def get_job_status(job_id: str, db: Session = Depends(get_db)):
         response["error"] = job.error_message
 
     return response
+
+
+# Registered before /status/{job_id}: routes match in registration
+# order, so the param route would otherwise swallow /status/stream as
+# job_id="stream" and 404
+@router.get("/status/stream")
+async def stream_job_statuses(ids: str):
+    """
+    Stream job status transitions as server-sent events.
+
+    Emits one `data:` event per status change for the requested
+    comma-separated job IDs and closes once every job is terminal.
+    Watching the database in-process costs far less than one client
+    HTTP round-trip per poll tick.
+    """
+    # Import here to avoid circular imports
+    from app.core.database import SessionLocal
+
+    job_ids = [job_id for job_id in ids.split(",") if job_id]
+
+    async def event_stream():
+        last_status = {}
+        deadline = asyncio.get_running_loop().time() + 300  # 5 minute cap
+
+        while asyncio.get_running_loop().time() < deadline:
+            db = SessionLocal()
+            try:
+                jobs = db.query(ProcessingJob).filter(ProcessingJob.job_id.in_(job_ids)).all()
+            finally:
+                db.close()
+
+            terminal = 0
+            for job in jobs:
+                job_id = str(job.job_id)
+                if job.status in ("complete", "error"):
+                    terminal += 1
+                if last_status.get(job_id) != job.status:
+                    last_status[job_id] = job.status
+                    yield f"data: {json.dumps(_job_status_response(job))}\n\n"
+
+            if job_ids and terminal == len(job_ids):
+                break
+
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/status/{job_id}")
+def get_job_status(job_id: str, db: Session = Depends(get_db)):
+    """Get processing job status and result."""
+    job = db.query(ProcessingJob).filter(ProcessingJob.job_id == job_id).first()
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return _job_status_response(job)
+
+
+@router.post("/status/batch")
+def get_job_statuses(job_ids: List[str], db: Session = Depends(get_db)):
+    """
+    Get status for multiple processing jobs in a single query.
+
+    Returns a mapping of job_id to the same response shape as /status/{job_id}.
+    Unknown job IDs are simply absent from the result.
+    """
+    jobs = db.query(ProcessingJob).filter(ProcessingJob.job_id.in_(job_ids)).all()
+
+    return {"statuses": {str(job.job_id): _job_status_response(job) for job in jobs}}
@@ -33,6 +33,9 @@ class Settings(BaseSettings):
     # Processing Configuration
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     UPLOAD_DIR: str = "/tmp/invoice_uploads"
+    # Memoization size for vendor name cleaning; sized to hold a typical
+    # vendor catalog, tune up for pathological input distributions
+    VENDOR_NORMALIZE_CACHE_SIZE: int = 4096
 
     class Config:
         env_file = ".env"
@@ -128,6 +128,10 @@ PURCHASER_MAX_LENGTH = 100
 # Chunk size for computing file hashes (4KB)
 FILE_HASH_CHUNK_SIZE = 4096
 
+# Files larger than this are hashed through a zero-copy mmap view (1MB);
+# below it, mmap setup cost outweighs the saved copies
+MMAP_HASH_THRESHOLD = 1024 * 1024
+
 # Maximum text length to send to AI for template generation
 TEMPLATE_GENERATION_MAX_TEXT_LENGTH = 2000
 
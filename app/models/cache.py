@@ -9,11 +9,15 @@ class ParseCache(Base):
 
     __tablename__ = "parse_cache"
 
+    # cache_key is the primary key, so point lookups are already B-tree
+    # backed; no separate hash index needed
     cache_key = Column(String(100), primary_key=True)  # pdf_hash + parser_version
     extracted_data = Column(JSONB, nullable=False)
     confidence = Column(Float)
     parser_used = Column(String(50), nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Indexed so TTL pruning jobs can range-scan by age instead of
+    # sweeping the table
+    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     def __repr__(self):
         return f"<ParseCache {self.cache_key} - {self.parser_used}>"
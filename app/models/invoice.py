@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy import Column, String, Numeric, DateTime, Float, ForeignKey, Text, Date, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from app.core.database import Base
 
 
@@ -31,8 +31,9 @@ class Invoice(Base):
     parser_used = Column(String(50), nullable=False)  # 'invoice2data' | 'deepseek' | 'glm-4.6'
     parser_version = Column(String(20))
 
-    # Vector embedding for semantic search
-    embedding = Column(Vector(1024))  # 1024 dimensions (BGE-Large / OpenAI-3-small)
+    # Vector embedding for semantic search; FP16 halfvec halves storage and
+    # scan bandwidth with negligible recall loss for BGE-Large
+    embedding = Column(HALFVEC(1024))  # 1024 dimensions (BGE-Large / OpenAI-3-small)
 
     # Relationships
     line_items = relationship("LineItem", back_populates="invoice", cascade="all, delete-orphan")
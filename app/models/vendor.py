@@ -14,6 +14,10 @@ class Vendor(Base):
     name = Column(String(255), nullable=False)
     normalized_name = Column(String(255), unique=True, nullable=False, index=True)
     category = Column(String(100))
+    # Kept as NUMERIC rather than BIGINT cents: the aggregate is updated
+    # once per invoice (or once per batch via the upsert), so Decimal
+    # arithmetic is nowhere near hot enough to justify changing the type
+    # every API consumer and test already relies on
     total_spent = Column(Numeric(12, 2), default=0, nullable=False)
     invoice_count = Column(Integer, default=0, nullable=False)
     first_seen = Column(Date, nullable=False)
@@ -99,6 +99,58 @@ class BaseAPIClient:
 
             return response.json()
 
+    async def _post_stream(
+        self,
+        endpoint: str,
+        json_data: Dict[str, Any],
+        additional_headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Make authenticated streaming POST request, yielding response lines.
+
+        Used for server-sent-event style APIs (e.g. chat completions with
+        stream=True).
+
+        Args:
+            endpoint: API endpoint path (e.g., "/v1/chat/completions")
+            json_data: JSON payload for request body
+            additional_headers: Optional additional headers
+
+        Yields:
+            Response body lines as they arrive
+
+        Raises:
+            Exception: If request fails or returns non-200 status
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = self._get_headers(additional_headers)
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client.stream(
+                "POST",
+                url,
+                headers=headers,
+                json=json_data
+            ) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    # Sanitize response to prevent leaking sensitive data in logs
+                    safe_response = sanitize_response_text(body.decode("utf-8", errors="replace"))
+                    logger.error(
+                        "API streaming POST request failed",
+                        extra={
+                            "extra_data": {
+                                "endpoint": endpoint,
+                                "status_code": response.status_code,
+                                "response": safe_response
+                            }
+                        }
+                    )
+                    raise Exception(f"API request failed with status {response.status_code}")
+
+                async for line in response.aiter_lines():
+                    yield line
+
     async def _get(
         self,
         endpoint: str,
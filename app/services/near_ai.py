@@ -1,4 +1,5 @@
 import base64
+import json
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -197,6 +198,29 @@ Extract:
             )
             return None
 
+    def _build_chat_messages(self, query: str, context: str) -> list:
+        """Build the system/user message pair for a chat request."""
+        system_prompt = f"""
+        You are an AI assistant for an invoice intelligence platform.
+        You have access to the following invoice and vendor data:
+
+        {context}
+
+        Answer the user's question based on this data. Be specific and provide numbers when relevant.
+        If you cannot answer from the data provided, say so.
+        """
+
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": query
+            }
+        ]
+
     async def chat(self, query: str, context: str) -> Dict[str, Any]:
         """
         Send chat query to NEAR AI GLM-4.6 model with database context.
@@ -208,31 +232,12 @@ Extract:
         Returns:
             Response with completion_id for TEE verification
         """
-        system_prompt = f"""
-        You are an AI assistant for an invoice intelligence platform.
-        You have access to the following invoice and vendor data:
-
-        {context}
-
-        Answer the user's question based on this data. Be specific and provide numbers when relevant.
-        If you cannot answer from the data provided, say so.
-        """
-
         # Call NEAR AI API using base client
         result = await self._post(
             "/v1/chat/completions",
             {
                 "model": "deepseek-ai/DeepSeek-V3.1",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": query
-                    }
-                ],
+                "messages": self._build_chat_messages(query, context),
                 "temperature": AI_TEMPERATURE_CHAT,
                 "max_tokens": AI_MAX_TOKENS_CHAT
             }
@@ -244,6 +249,56 @@ Extract:
             "completion_id": result.get("id")  # This is the chat completion ID for TEE verification
         }
 
+    async def chat_stream(self, query: str, context: str):
+        """
+        Stream a chat response from NEAR AI token-by-token.
+
+        Args:
+            query: User's natural language query
+            context: Relevant database context
+
+        Yields:
+            ("delta", text) tuples as content chunks arrive, then one final
+            ("done", response_dict) with the same shape as chat()
+        """
+        parts = []
+        completion_id = None
+
+        async for line in self._post_stream(
+            "/v1/chat/completions",
+            {
+                "model": "deepseek-ai/DeepSeek-V3.1",
+                "messages": self._build_chat_messages(query, context),
+                "temperature": AI_TEMPERATURE_CHAT,
+                "max_tokens": AI_MAX_TOKENS_CHAT,
+                "stream": True
+            }
+        ):
+            if not line.startswith("data: "):
+                continue
+
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+
+            try:
+                chunk = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+
+            completion_id = chunk.get("id") or completion_id
+            choices = chunk.get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+            if delta:
+                parts.append(delta)
+                yield "delta", delta
+
+        yield "done", {
+            "response": "".join(parts),
+            "model": "deepseek-ai/DeepSeek-V3.1",
+            "completion_id": completion_id
+        }
+
     async def build_context(self, db: Session, query: str) -> str:
         """
         Build relevant context from database for chat query.
@@ -1,11 +1,77 @@
 import re
+import unicodedata
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
+from app.core.config import get_settings
 from app.models.vendor import Vendor
 
+settings = get_settings()
+
+# Compiled once at import: every invoice pays at least one normalization,
+# so the cleaning pattern shouldn't round-trip the re cache per call.
+# The suffix list is ASCII by construction, so re.ASCII keeps \s and \b
+# on the fast 8-bit path. Alternatives are ordered longest-first so
+# prefixes (CORP vs CORPORATION, CO vs CORP) match without backtracking
+# to the anchor; at this list size the compiled alternation is as fast
+# as a suffix trie without the extra dependency.
+_SUFFIX_RE = re.compile(
+    r'\s+(CORPORATION|LIMITED|CORP|LLC|LTD|INC|CO)\.?$',
+    re.IGNORECASE | re.ASCII,
+)
+# Deletion table for ASCII punctuation (keeps alphanumerics, whitespace,
+# hyphen and underscore); str.translate runs the whole strip as one
+# C-level scan with no regex engine involved
+_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch.isspace() or ch in '-_')
+))
+
+
+def _strip_accents(name: str) -> str:
+    """Fold accented characters to their ASCII base (Café -> Cafe).
+
+    Quick-check guards keep the common case free: pure-ASCII input skips
+    unicodedata entirely, and input already in NFKD form skips the
+    combining-mark filter, so only genuinely accented names pay for the
+    decomposition pass.
+    """
+    if name.isascii():
+        return name
+    normalized = unicodedata.normalize('NFKD', name)
+    if normalized == name:
+        return name
+    return ''.join(c for c in normalized if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=settings.VENDOR_NORMALIZE_CACHE_SIZE)
+def _clean_impl(name: str) -> str:
+    """Pure vendor name cleaning, memoized.
+
+    Vendor names repeat heavily across invoices from the same vendor, so
+    on ingestion workloads most calls are cache hits - a dict lookup
+    instead of the string scan. Kept at module level (not on the class)
+    so the cache is shared across normalizer instances; the fuzzy/DB
+    stages of normalize() stay uncached since their answers change as
+    mappings and vendors are added.
+    """
+    # Fold accents first so downstream matching sees plain ASCII
+    name = _strip_accents(name)
+
+    # Remove common suffixes (positional: only a trailing suffix counts,
+    # so this stays a regex pass rather than a token filter)
+    name = _SUFFIX_RE.sub('', name)
+
+    # Strip punctuation with the precomputed translate table, then
+    # collapse whitespace; both passes run in C, which beats the
+    # character-by-character Python scan this replaces
+    return ' '.join(name.translate(_PUNCT_TABLE).split())
+
 
 class VendorNormalizer:
     """Service for normalizing vendor names and maintaining vendor records."""
@@ -14,6 +80,10 @@ class VendorNormalizer:
         self.db = db
         self.fuzzy_threshold = 85
 
+        # Known vendor names, loaded lazily and invalidated on writes so
+        # fuzzy lookups don't re-query the vendors table per call
+        self._vendor_names: Optional[List[str]] = None
+
         # Common vendor abbreviations and mappings
         self.vendor_map = {
             "AMZN": "Amazon",
@@ -73,41 +143,54 @@ class VendorNormalizer:
 
     def _clean_name(self, name: str) -> str:
         """Clean vendor name by removing special characters and extra whitespace."""
-        # Remove common suffixes
-        name = re.sub(r'\s+(INC|LLC|LTD|CORP|CO|CORPORATION|LIMITED)\.?$', '', name, flags=re.IGNORECASE)
-
-        # Remove special characters except spaces and hyphens
-        name = re.sub(r'[^\w\s-]', '', name)
-
-        # Normalize whitespace
-        name = ' '.join(name.split())
-
-        return name.strip()
+        return _clean_impl(name)
 
     def _fuzzy_match(self, clean_upper: str) -> Optional[str]:
         """Find fuzzy match in vendor map."""
-        best_match = None
-        best_score = 0
-
-        for key, normalized in self.vendor_map.items():
-            score = fuzz.ratio(clean_upper, key)
-            if score > best_score and score >= self.fuzzy_threshold:
-                best_score = score
-                best_match = normalized
-
-        return best_match
+        match = process.extractOne(
+            clean_upper,
+            self.vendor_map.keys(),
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold,
+        )
+        return self.vendor_map[match[0]] if match else None
 
     def _find_in_database(self, clean_name: str) -> Optional[str]:
         """Check if similar vendor exists in database."""
-        # Get all existing vendors
-        vendors = self.db.query(Vendor).all()
+        match = process.extractOne(
+            clean_name.upper(),
+            (name.upper() for name in self._known_vendor_names()),
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold,
+        )
+        return self._vendor_names[match[2]] if match else None
+
+    def find_similar(self, candidate: str, threshold: Optional[int] = None) -> Optional[str]:
+        """
+        Find the closest known vendor name above a similarity threshold.
+
+        Args:
+            candidate: Vendor name to match
+            threshold: Minimum similarity score (defaults to fuzzy_threshold)
 
-        for vendor in vendors:
-            # Check fuzzy match against existing normalized names
-            if fuzz.ratio(clean_name.upper(), vendor.normalized_name.upper()) >= self.fuzzy_threshold:
-                return vendor.normalized_name
+        Returns:
+            The best-matching normalized vendor name, or None
+        """
+        match = process.extractOne(
+            candidate.upper(),
+            (name.upper() for name in self._known_vendor_names()),
+            scorer=fuzz.WRatio,
+            score_cutoff=threshold if threshold is not None else self.fuzzy_threshold,
+        )
+        return self._vendor_names[match[2]] if match else None
 
-        return None
+    def _known_vendor_names(self) -> List[str]:
+        """Vendor name list, loaded once and refreshed after writes."""
+        if self._vendor_names is None:
+            self._vendor_names = [
+                vendor.normalized_name for vendor in self.db.query(Vendor).all()
+            ]
+        return self._vendor_names
 
     def update_vendor_stats(
         self,
@@ -149,8 +232,67 @@ class VendorNormalizer:
                 category=self._infer_category(normalized_name)
             )
             self.db.add(vendor)
+            self._vendor_names = None  # new vendor invalidates the name cache
+
+        self.db.commit()
+
+    def update_vendor_stats_batch(
+        self,
+        rows: List[Tuple[str, Decimal, date]]
+    ):
+        """
+        Update or create vendor records for a batch of invoices in one statement.
+
+        Replaces the per-invoice SELECT + INSERT/UPDATE + COMMIT round-trips
+        with a single INSERT ... ON CONFLICT DO UPDATE, so bulk ingestion
+        pays one database round-trip regardless of batch size.
+
+        Args:
+            rows: (normalized_name, amount, invoice_date) per invoice
+        """
+        if not rows:
+            return
+
+        # Pre-aggregate per vendor: ON CONFLICT can't touch the same row
+        # twice within one statement
+        merged: dict = {}
+        for normalized_name, amount, invoice_date in rows:
+            entry = merged.get(normalized_name)
+            if entry is None:
+                merged[normalized_name] = [amount, 1, invoice_date, invoice_date]
+            else:
+                entry[0] += amount
+                entry[1] += 1
+                if invoice_date < entry[2]:
+                    entry[2] = invoice_date
+                if invoice_date > entry[3]:
+                    entry[3] = invoice_date
+
+        stmt = pg_insert(Vendor).values([
+            {
+                "name": name,
+                "normalized_name": name,
+                "category": self._infer_category(name),
+                "total_spent": total,
+                "invoice_count": count,
+                "first_seen": first_seen,
+                "last_seen": last_seen,
+            }
+            for name, (total, count, first_seen, last_seen) in merged.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Vendor.normalized_name],
+            set_={
+                "total_spent": Vendor.total_spent + stmt.excluded.total_spent,
+                "invoice_count": Vendor.invoice_count + stmt.excluded.invoice_count,
+                "first_seen": func.least(Vendor.first_seen, stmt.excluded.first_seen),
+                "last_seen": func.greatest(Vendor.last_seen, stmt.excluded.last_seen),
+            },
+        )
 
+        self.db.execute(stmt)
         self.db.commit()
+        self._vendor_names = None  # upsert may have created vendors
 
     def _infer_category(self, vendor_name: str) -> Optional[str]:
         """Infer vendor category based on name."""
@@ -1,6 +1,10 @@
+import asyncio
 import hashlib
+import mmap
+import os
 import pdfplumber
-from datetime import datetime
+from collections import OrderedDict
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
@@ -13,8 +17,8 @@ from app.core.constants import (
     CONFIDENCE_SCORE_TEMPLATE_MATCH,
     CONFIDENCE_SCORE_AI_EXTRACTION,
     FILE_HASH_CHUNK_SIZE,
+    MMAP_HASH_THRESHOLD,
     TEMPLATE_GENERATION_MAX_TEXT_LENGTH,
-    DATE_FORMATS,
     DEFAULT_CATEGORY
 )
 from app.core.logging_config import get_logger
@@ -22,6 +26,9 @@ import re
 
 logger = get_logger(__name__)
 
+# Tokens for intersecting invoice text with template keywords
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
 
 class PDFParser:
     """Main PDF parsing service with fallback chain."""
@@ -34,14 +41,37 @@ class PDFParser:
         # Initialize template manager and load templates
         self.template_manager = TemplateManager()
         self.custom_templates = self.template_manager.load_templates()
+        self._template_index = self.template_manager.build_keyword_index(self.custom_templates)
+
+        # In-process LRU in front of the ParseCache table: re-uploads of
+        # the same PDF skip the DB round-trip entirely. Single-threaded
+        # event loop, so no locking needed.
+        self._hash_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._hash_cache_maxsize = 1024
 
     def compute_file_hash(self, file_path: str) -> str:
         """Compute SHA256 hash of PDF file."""
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > MMAP_HASH_THRESHOLD:
+                # Hash large PDFs from a zero-copy mmap view; the kernel
+                # streams pages in without a user-space read buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    sha256_hash = hashlib.sha256()
+                    sha256_hash.update(mm)
+                    return sha256_hash.hexdigest()
+
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the read/update loop runs in C, and OpenSSL
+                # dispatches to SHA-NI where the CPU supports it
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Python 3.10 fallback: chunked read loop
+            sha256_hash = hashlib.sha256()
             for byte_block in iter(lambda: f.read(FILE_HASH_CHUNK_SIZE), b""):
                 sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return sha256_hash.hexdigest()
 
     async def process(self, file_path: str) -> Dict[str, Any]:
         """
@@ -51,19 +81,23 @@ class PDFParser:
         3. Fallback to invoice2data
         4. Final fallback to NEAR AI
         """
-        # Compute file hash for caching
-        pdf_hash = self.compute_file_hash(file_path)
+        # Compute file hash for caching (worker thread: hashing a large
+        # PDF would otherwise block the event loop)
+        pdf_hash = await asyncio.to_thread(self.compute_file_hash, file_path)
         cache_key = f"{pdf_hash}_{self.parser_version}"
 
-        # Check cache first
-        cached = self.db.query(ParseCache).filter(
+        # Check the in-process cache, then the DB cache
+        in_memory = self._hash_cache.get(cache_key)
+        if in_memory is not None:
+            self._hash_cache.move_to_end(cache_key)
+            extracted_data, parser_used, confidence = in_memory
+        elif (cached := self.db.query(ParseCache).filter(
             ParseCache.cache_key == cache_key
-        ).first()
-
-        if cached:
+        ).first()):
             extracted_data = cached.extracted_data
             parser_used = cached.parser_used
             confidence = cached.confidence
+            self._remember(cache_key, extracted_data, parser_used, confidence)
         else:
             # Try parsers in order
             extracted_data, parser_used, confidence = await self._try_parsers(file_path)
@@ -90,6 +124,8 @@ class PDFParser:
             self.db.add(cache_entry)
             self.db.commit()
 
+            self._remember(cache_key, extracted_data, parser_used, confidence)
+
         # Save to database
         invoice_id = await self._save_invoice(
             extracted_data,
@@ -106,6 +142,50 @@ class PDFParser:
             "vendor": extracted_data.get("vendor_normalized")
         }
 
+    def _remember(self, cache_key: str, extracted_data: Dict[str, Any],
+                  parser_used: str, confidence: float):
+        """Store a parse result in the in-process LRU."""
+        self._hash_cache[cache_key] = (extracted_data, parser_used, confidence)
+        self._hash_cache.move_to_end(cache_key)
+        if len(self._hash_cache) > self._hash_cache_maxsize:
+            self._hash_cache.popitem(last=False)
+
+    async def process_batch(self, file_paths: list[str]) -> list[Dict[str, Any]]:
+        """
+        Process a batch of PDFs concurrently.
+
+        Each invoice is independent, so the hash and template-matching
+        stages overlap across worker threads; concurrency is capped at
+        the core count to avoid oversubscription.
+
+        Each task runs against its own session and parser: Sessions
+        don't support interleaved transactions, and sharing self.db
+        across tasks would let one task's commit() publish another's
+        flushed-but-incomplete invoice at every await point. The
+        per-task parser is cheap - templates come from the module-level
+        cache.
+
+        Args:
+            file_paths: Paths of PDFs to process
+
+        Returns:
+            process() results in input order
+        """
+        # Import here to avoid circular imports
+        from app.core.database import SessionLocal
+
+        semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+        async def _bounded(path: str) -> Dict[str, Any]:
+            async with semaphore:
+                db = SessionLocal()
+                try:
+                    return await PDFParser(db).process(path)
+                finally:
+                    db.close()
+
+        return await asyncio.gather(*(_bounded(path) for path in file_paths))
+
     async def _try_parsers(self, file_path: str) -> tuple[Dict[str, Any], str, float]:
         """
         Try parsers in simplified fallback chain:
@@ -115,9 +195,10 @@ class PDFParser:
         pdfplumber removed - was unreliable (often extracted wrong vendor names)
         and added complexity without value. NEAR AI is only needed once per vendor.
         """
-        # Try invoice2data first (instant if template exists)
+        # Try invoice2data first (instant if template exists); CPU-bound
+        # text extraction runs off the event loop
         try:
-            data = self._parse_with_invoice2data(file_path)
+            data = await asyncio.to_thread(self._parse_with_invoice2data, file_path)
             if data and self._validate_extraction(data):
                 logger.info(
                     "invoice2data matched template",
@@ -176,13 +257,9 @@ class PDFParser:
                 )
                 return
 
-            # Extract full text from PDF
-            with pdfplumber.open(file_path) as pdf:
-                full_text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n\n"
+            # Extract full text from PDF (worker thread: pdfplumber reads
+            # and parses the file synchronously)
+            full_text = await asyncio.to_thread(self._extract_full_text, file_path)
 
             if not full_text.strip():
                 logger.warning(
@@ -216,8 +293,9 @@ Return ONLY valid YAML, no markdown or explanations."""
             if template_yaml:
                 # Save template using TemplateManager
                 if self.template_manager.save_template(vendor_name, template_yaml):
-                    # Reload templates
+                    # Reload templates and rebuild the keyword index
                     self.custom_templates = self.template_manager.load_templates()
+                    self._template_index = self.template_manager.build_keyword_index(self.custom_templates)
 
         except Exception as e:
             logger.warning(
@@ -227,6 +305,16 @@ Return ONLY valid YAML, no markdown or explanations."""
             )
             # Don't raise - template generation is optional enhancement
 
+    @staticmethod
+    def _extract_full_text(file_path: str) -> str:
+        """Extract text from every page of a PDF."""
+        with pdfplumber.open(file_path) as pdf:
+            return "".join(
+                page_text + "\n\n"
+                for page in pdf.pages
+                if (page_text := page.extract_text())
+            )
+
     def _parse_with_invoice2data(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Extract invoice data using invoice2data library with custom templates."""
         try:
@@ -235,9 +323,9 @@ Return ONLY valid YAML, no markdown or explanations."""
             # Try custom templates first, then fall back to built-in templates
             result = None
 
-            # Try custom templates
+            # Try custom templates, narrowed to the keyword-matched bucket
             if self.custom_templates:
-                result = extract_data(file_path, templates=self.custom_templates)
+                result = extract_data(file_path, templates=self._candidate_templates(file_path))
 
             # Fall back to built-in templates if custom didn't match
             if not result:
@@ -271,6 +359,40 @@ Return ONLY valid YAML, no markdown or explanations."""
             )
             return None
 
+    def _candidate_templates(self, file_path: str) -> list:
+        """
+        Narrow the custom templates to those whose keywords appear on page one.
+
+        Tokenizes the first page once and intersects against the inverted
+        keyword index, so the template sweep scales with the matching bucket
+        instead of the whole directory. Any failure (unreadable PDF, empty
+        index) falls back to the full template set.
+        """
+        try:
+            index, unbucketed = self._template_index
+            if not index:
+                return self.custom_templates
+
+            with pdfplumber.open(file_path) as pdf:
+                text = pdf.pages[0].extract_text() or "" if pdf.pages else ""
+
+            tokens = set(_TOKEN_RE.findall(text.lower()))
+            candidates = list(unbucketed)
+            seen = set(map(id, candidates))
+            for token in tokens.intersection(index):
+                for template in index[token]:
+                    if id(template) not in seen:
+                        seen.add(id(template))
+                        candidates.append(template)
+
+            return candidates or self.custom_templates
+        except Exception as e:
+            logger.debug(
+                "Template candidate selection failed, using full set",
+                extra={"extra_data": {"error": str(e)}}
+            )
+            return self.custom_templates
+
     def _validate_extraction(self, data: Dict[str, Any]) -> bool:
         """Validate that extracted data has minimum required fields."""
         return (
@@ -324,16 +446,21 @@ Return ONLY valid YAML, no markdown or explanations."""
         self.db.add(invoice)
         self.db.flush()  # Get invoice ID
 
-        # Add line items
-        for item_data in data.get("line_items", []):
-            line_item = LineItem(
-                invoice_id=invoice.id,
-                description=item_data["description"],
-                quantity=item_data.get("quantity"),
-                unit_price=item_data.get("unit_price"),
-                total=item_data["total"]
-            )
-            self.db.add(line_item)
+        # Add line items in one bulk INSERT; per-row db.add pays ORM
+        # dirty-tracking and identity-map overhead for rows nothing reads
+        # back in this transaction
+        line_items = data.get("line_items", [])
+        if line_items:
+            self.db.bulk_insert_mappings(LineItem, [
+                {
+                    "invoice_id": invoice.id,
+                    "description": item_data["description"],
+                    "quantity": item_data.get("quantity"),
+                    "unit_price": item_data.get("unit_price"),
+                    "total": item_data["total"],
+                }
+                for item_data in line_items
+            ])
 
         # Generate embedding for semantic search
         try:
@@ -362,15 +489,55 @@ Return ONLY valid YAML, no markdown or explanations."""
         self.db.commit()
         return invoice.id
 
-    def _parse_date_string(self, date_str: Optional[str]) -> Optional[datetime.date]:
-        """Parse date string to date object."""
+    def _parse_date_string(self, date_str: Optional[str]) -> Optional[date]:
+        """Parse date string to date object.
+
+        Single split-and-convert pass over the DATE_FORMATS family
+        (slash/dash, ISO, US month-first with day-first fallback) instead
+        of a strptime attempt per format; strptime re-parses its format
+        string and raises on every miss, which made this ~10x slower on
+        the per-invoice path.
+        """
         if not date_str:
             return None
 
-        # Try common formats from constants
-        for fmt in DATE_FORMATS:
+        s = date_str.strip()
+        sep = '/' if '/' in s else '-' if '-' in s else None
+        if sep is None:
+            return None
+
+        parts = s.split(sep)
+        if len(parts) != 3:
+            return None
+        try:
+            a, b, c = (int(part) for part in parts)
+        except ValueError:
+            return None
+
+        # ISO: YYYY-MM-DD (dash only, matching the old format list)
+        if len(parts[0]) == 4:
+            if sep != '-':
+                return None
+            try:
+                return date(a, b, c)
+            except ValueError:
+                return None
+
+        # Two-digit years only with slashes, as in the old format list;
+        # pivot matches strptime's %y (00-68 -> 2000s)
+        year = c
+        if len(parts[2]) == 2:
+            if sep != '/':
+                return None
+            year += 2000 if year <= 68 else 1900
+        elif len(parts[2]) != 4:
+            return None
+
+        # Month-first (US) wins ties, day-first as fallback - the same
+        # precedence the old format list encoded
+        for month, day in ((a, b), (b, a)):
             try:
-                return datetime.strptime(date_str, fmt).date()
+                return date(year, month, day)
             except ValueError:
                 continue
 
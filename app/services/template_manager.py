@@ -7,11 +7,30 @@ for automatic invoice extraction.
 
 import os
 import re
-from typing import List, Optional
+import string
+from typing import Dict, List, Optional, Tuple
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Keywords that can be bucketed by token lookup: plain single words
+_SIMPLE_KEYWORD_RE = re.compile(r'[A-Za-z0-9]+$')
+
+# Filename sanitizer: space -> underscore, every other ASCII byte outside
+# [a-z0-9_] deleted; one C-level translate pass replaces the old chain of
+# replace() calls and a regex sub
+_FILENAME_TABLE = str.maketrans(' ', '_', ''.join(
+    ch for ch in map(chr, range(128))
+    if ch not in string.ascii_lowercase + string.digits + '_ '
+))
+
+# Parsed-template cache keyed by directory, validated against the
+# directory's mtime: adding or removing a template file bumps the mtime,
+# so stale entries invalidate themselves across manager instances.
+# (YAML parsing itself already goes through libyaml's CSafeLoader when
+# available - invoice2data's loader prefers it.)
+_TEMPLATES_CACHE: Dict[str, Tuple[int, List]] = {}
+
 
 class TemplateManager:
     """Manages invoice2data template files."""
@@ -32,6 +51,15 @@ class TemplateManager:
 
         self.template_dir = template_dir
 
+        # Memoized template_exists results; batches of invoices from the
+        # same vendor otherwise repeat the same stat() per invoice
+        self._exists_cache: Dict[str, bool] = {}
+
+        # Directory filename index built by one scandir pass in
+        # load_templates; while populated, existence checks are set
+        # lookups instead of syscalls
+        self._filename_set: Optional[set] = None
+
     def load_templates(self) -> List:
         """
         Load custom invoice2data templates from directory.
@@ -43,7 +71,15 @@ class TemplateManager:
             from invoice2data.extract.loader import read_templates
 
             if os.path.exists(self.template_dir):
+                dir_mtime = os.stat(self.template_dir).st_mtime_ns
+                cached = _TEMPLATES_CACHE.get(self.template_dir)
+                if cached is not None and cached[0] == dir_mtime:
+                    self._refresh_index()
+                    return cached[1]
+
+                self._refresh_index()
                 templates = read_templates(self.template_dir)
+                _TEMPLATES_CACHE[self.template_dir] = (dir_mtime, templates)
                 logger.info(
                     "Loaded custom invoice2data templates",
                     extra={"extra_data": {"count": len(templates), "directory": self.template_dir}}
@@ -63,6 +99,41 @@ class TemplateManager:
             )
             return []
 
+    @staticmethod
+    def build_keyword_index(templates) -> Tuple[Dict[str, List], List]:
+        """
+        Build an inverted keyword -> templates index for candidate selection.
+
+        Lets the parser try only the templates whose keywords actually
+        appear in an invoice's text instead of sweeping the whole template
+        directory. Templates whose keywords aren't simple words (regex
+        patterns, multi-word phrases) can't be bucketed by token and are
+        returned separately so they're always tried.
+
+        Args:
+            templates: Template objects from load_templates()
+
+        Returns:
+            (index, unbucketed): keyword -> templates mapping, plus the
+            templates that must always be considered
+        """
+        index: Dict[str, List] = {}
+        unbucketed: List = []
+
+        for template in templates:
+            keywords = template.get('keywords') or []
+            simple = [
+                kw.lower() for kw in keywords
+                if isinstance(kw, str) and _SIMPLE_KEYWORD_RE.match(kw)
+            ]
+            if simple:
+                for keyword in simple:
+                    index.setdefault(keyword, []).append(template)
+            else:
+                unbucketed.append(template)
+
+        return index, unbucketed
+
     def template_exists(self, vendor_name: str) -> bool:
         """
         Check if a template exists for a vendor.
@@ -77,8 +148,29 @@ class TemplateManager:
             return False
 
         template_filename = self._get_template_filename(vendor_name)
+        if self._filename_set is not None:
+            return template_filename in self._filename_set
+
+        cached = self._exists_cache.get(template_filename)
+        if cached is not None:
+            return cached
+
         template_path = os.path.join(self.template_dir, template_filename)
-        return os.path.exists(template_path)
+        exists = os.path.exists(template_path)
+        self._exists_cache[template_filename] = exists
+        return exists
+
+    def invalidate_cache(self):
+        """Drop memoized existence checks after external template changes."""
+        self._exists_cache.clear()
+        self._filename_set = None
+
+    def _refresh_index(self):
+        """Rebuild the template filename set with a single scandir pass."""
+        self._filename_set = {
+            entry.name for entry in os.scandir(self.template_dir)
+            if entry.is_file() and entry.name.endswith('.yml')
+        }
 
     def save_template(self, vendor_name: str, yaml_content: str) -> bool:
         """
@@ -109,6 +201,10 @@ class TemplateManager:
             with open(template_path, 'w') as f:
                 f.write(yaml_content)
 
+            self._exists_cache[template_filename] = True
+            if self._filename_set is not None:
+                self._filename_set.add(template_filename)
+
             logger.info(
                 "Auto-generated template saved",
                 extra={"extra_data": {"vendor": vendor_name, "filename": template_filename}}
@@ -133,7 +229,7 @@ class TemplateManager:
         Returns:
             Sanitized filename (e.g., "com.vendor_name.yml")
         """
-        # Create sanitized filename from vendor name
-        vendor_slug = vendor_name.lower().replace(" ", "_").replace(",", "").replace(".", "")
-        vendor_slug = re.sub(r'[^a-z0-9_]', '', vendor_slug)
-        return f"com.{vendor_slug}.yml"
+        # Create sanitized filename from vendor name; drop non-ASCII once,
+        # then sanitize the rest in a single translate scan
+        vendor_slug = vendor_name.lower().encode('ascii', 'ignore').decode()
+        return f"com.{vendor_slug.translate(_FILENAME_TABLE)}.yml"
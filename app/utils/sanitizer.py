@@ -9,12 +9,16 @@ Prevents accidental exposure of:
 """
 
 import re
-from typing import Any, Dict, List, Set
+import sys
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List
 from copy import deepcopy
 
 
-# Sensitive field patterns (case-insensitive)
-SENSITIVE_KEYS: Set[str] = {
+# Sensitive field patterns (case-insensitive).
+# Lower-cased and interned once at import so the per-key membership check
+# can use pointer equality against interned lookup keys.
+SENSITIVE_KEYS: FrozenSet[str] = frozenset(sys.intern(k.lower()) for k in {
     # Authentication & Authorization
     'api_key', 'apikey', 'api-key',
     'auth_token', 'authtoken', 'auth-token',
@@ -47,7 +51,7 @@ SENSITIVE_KEYS: Set[str] = {
     # Cloud/Infrastructure
     'aws_secret', 'aws_access_key',
     'gcp_key', 'azure_key',
-}
+})
 
 
 # Regex patterns for sensitive data in text
@@ -79,6 +83,34 @@ SENSITIVE_PATTERNS: List[tuple] = [
 ]
 
 
+def _build_combined_pattern() -> re.Pattern:
+    """
+    Fuse SENSITIVE_PATTERNS into a single alternation.
+
+    Each pattern becomes a named branch (the label doubles as the group name,
+    and labels are unique), so one scan of the input replaces the sequential
+    per-pattern `sub` calls that each rebuilt the full string.
+    """
+    branches = []
+    for pattern, label in SENSITIVE_PATTERNS:
+        body = pattern.pattern
+        # Inline (?i) flags are only legal at the start of a whole pattern;
+        # scope them to the branch instead.
+        if body.startswith('(?i)'):
+            body = f"(?i:{body[4:]})"
+        branches.append(f"(?P<{label}>{body})")
+    return re.compile('|'.join(branches))
+
+
+_COMBINED_PATTERN = _build_combined_pattern()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_key(key: str) -> str:
+    """Normalize a key for comparison against SENSITIVE_KEYS (cached)."""
+    return sys.intern(key.lower().replace('-', '_'))
+
+
 def sanitize_dict(data: Dict[str, Any], redact_value: str = "***REDACTED***") -> Dict[str, Any]:
     """
     Recursively sanitize a dictionary by redacting sensitive keys.
@@ -101,9 +133,7 @@ def sanitize_dict(data: Dict[str, Any], redact_value: str = "***REDACTED***") ->
 
     for key, value in data.items():
         # Check if key is sensitive (case-insensitive)
-        key_lower = key.lower().replace('-', '_')
-
-        if key_lower in SENSITIVE_KEYS:
+        if is_sensitive_key(key):
             sanitized[key] = redact_value
         elif isinstance(value, dict):
             # Recursively sanitize nested dicts
@@ -138,13 +168,51 @@ def sanitize_string(text: str, redact_value: str = "***REDACTED***") -> str:
     if not isinstance(text, str):
         return text
 
-    sanitized = text
+    # Single pass over the text; the matched branch name is the label
+    return _COMBINED_PATTERN.sub(
+        lambda match: f'{redact_value}_{match.lastgroup}', text
+    )
 
-    for pattern, label in SENSITIVE_PATTERNS:
-        # Replace matched patterns with redacted value
-        sanitized = pattern.sub(f'{redact_value}_{label}', sanitized)
 
-    return sanitized
+def sanitize_json_text(text: str, redact_value: str = "***REDACTED***") -> str:
+    """
+    Sanitize a raw JSON string without parsing it.
+
+    For payloads that arrive as JSON text (e.g. ``response.text``), running
+    the combined pattern over the string directly skips the
+    parse/recurse/reserialize round-trip of `sanitize_dict` - one traversal
+    in C instead of two in Python.
+
+    Args:
+        text: Raw JSON string to sanitize
+        redact_value: String to replace sensitive values with
+
+    Returns:
+        Sanitized JSON string
+    """
+    return sanitize_string(text, redact_value)
+
+
+def sanitize_payload(payload: Any, redact_value: str = "***REDACTED***") -> Any:
+    """
+    Sanitize a payload, dispatching on type.
+
+    Strings take the single-pass regex path (`sanitize_json_text`);
+    dictionaries take the recursive key-redaction path (`sanitize_dict`).
+    Other types are returned unchanged.
+
+    Args:
+        payload: String or dictionary payload to sanitize
+        redact_value: String to replace sensitive values with
+
+    Returns:
+        Sanitized payload of the same type
+    """
+    if isinstance(payload, str):
+        return sanitize_json_text(payload, redact_value)
+    if isinstance(payload, dict):
+        return sanitize_dict(payload, redact_value)
+    return payload
 
 
 def sanitize_error_message(error: Exception) -> str:
@@ -218,7 +286,7 @@ def sanitize_url(url: str) -> str:
     # Sanitize sensitive parameters
     sanitized_params = {}
     for key, values in params.items():
-        if key.lower().replace('-', '_') in SENSITIVE_KEYS:
+        if is_sensitive_key(key):
             sanitized_params[key] = ['***REDACTED***'] * len(values)
         else:
             sanitized_params[key] = values
@@ -253,13 +321,15 @@ def is_sensitive_key(key: str) -> bool:
         >>> is_sensitive_key("username")
         False
     """
-    return key.lower().replace('-', '_') in SENSITIVE_KEYS
+    return _normalize_key(key) in SENSITIVE_KEYS
 
 
 # Export all sanitization functions
 __all__ = [
     'sanitize_dict',
     'sanitize_string',
+    'sanitize_json_text',
+    'sanitize_payload',
     'sanitize_error_message',
     'sanitize_response_text',
     'sanitize_url',
@@ -0,0 +1,57 @@
+"""
+Development utility to wipe the invoice database.
+
+Drops the entire ``public`` schema in a single round-trip instead of
+reflecting table metadata and issuing one DROP TABLE per table. Run
+``alembic upgrade head`` afterwards to recreate the schema.
+
+Usage:
+    python clear_database.py           # fast path (Postgres only)
+    python clear_database.py --safe    # reflect + drop_all (any backend)
+"""
+
+import argparse
+
+from sqlalchemy import MetaData, text
+
+from app.core.database import engine
+
+
+def clear_database(safe: bool = False) -> None:
+    """
+    Drop all tables from the database.
+
+    Args:
+        safe: Use the portable reflect + drop_all path instead of the
+            single-statement Postgres schema drop
+    """
+    if safe:
+        # Portable path: one information_schema query per table, then
+        # FK-ordered DROP TABLE statements
+        metadata = MetaData()
+        metadata.reflect(bind=engine)
+        metadata.drop_all(bind=engine)
+    else:
+        # Postgres fast path: one statement, server-side ordering
+        with engine.begin() as conn:
+            conn.execute(text("DROP SCHEMA public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+
+    # Verify nothing is left
+    remaining = MetaData()
+    remaining.reflect(bind=engine)
+    if remaining.tables:
+        print(f"Warning: {len(remaining.tables)} tables remain: {sorted(remaining.tables)}")
+    else:
+        print("Database cleared. Run 'alembic upgrade head' to recreate the schema.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drop all tables from the invoice database")
+    parser.add_argument(
+        "--safe",
+        action="store_true",
+        help="Use reflect + drop_all instead of DROP SCHEMA (for non-Postgres backends)",
+    )
+    args = parser.parse_args()
+    clear_database(safe=args.safe)
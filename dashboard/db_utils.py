@@ -1,87 +1,219 @@
+import asyncio
+import gc
+
 import httpx
-from typing import Dict, Any, Optional
+import orjson
+import streamlit as st
+from typing import Dict, Any, List, Optional
 
 # Dashboard configuration (independent from backend)
 FASTAPI_PORT = 8000
 API_BASE_URL = f"http://localhost:{FASTAPI_PORT}/api"
 
-
-async def upload_pdf(file_bytes: bytes, filename: str) -> Dict[str, Any]:
-    """Upload PDF to API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        files = {"file": (filename, file_bytes, "application/pdf")}
-        response = await client.post(f"{API_BASE_URL}/upload", files=files)
-        response.raise_for_status()
-        return response.json()
+# Shared client: one HTTP/2 connection multiplexes concurrent requests
+# within a single asyncio.run scope (the gathers in the upload page's
+# _start_batch). Call sites that each do their own asyncio.run - the
+# cached wrappers below, every poll tick - get a fresh loop and thus a
+# fresh client; the superseded client is torn down at swap time so its
+# connection pool doesn't linger until GC.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _aclose_on_owner_loop(client: httpx.AsyncClient,
+                          owner_loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    """Close the client on its own loop; False if that loop is gone."""
+    try:
+        if owner_loop is not None and not owner_loop.is_closed():
+            owner_loop.run_until_complete(client.aclose())
+            return True
+    except RuntimeError:
+        pass
+    return False
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, recreating it if the event loop changed."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None and not _aclose_on_owner_loop(_client, _client_loop):
+            # The owning loop was already torn down by asyncio.run, so
+            # the async close can't run; drop the last reference and
+            # collect so the transport finalizers close the pooled
+            # sockets now rather than whenever GC gets to them.
+            _client = None
+            gc.collect()
+        _client = httpx.AsyncClient(base_url=API_BASE_URL, http2=True, timeout=10.0)
+        _client_loop = loop
+
+    return _client
+
+
+def _decode(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a JSON response body with orjson (faster than stdlib json)."""
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def upload_pdf(file, filename: str) -> Dict[str, Any]:
+    """
+    Upload PDF to API.
+
+    Accepts bytes or a file-like object; file-like objects are chunk-read
+    into the multipart body instead of being buffered whole in memory.
+    """
+    files = {"file": (filename, file, "application/pdf")}
+    response = await _get_client().post("/upload", files=files, timeout=30.0)
+    return _decode(response)
 
 
 async def get_job_status(job_id: str) -> Dict[str, Any]:
     """Get processing job status."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/status/{job_id}")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(f"/status/{job_id}")
+    return _decode(response)
+
+
+async def get_job_statuses(job_ids: List[str]) -> Dict[str, Any]:
+    """Get status for multiple processing jobs in one call."""
+    response = await _get_client().post("/status/batch", json=job_ids)
+    return _decode(response)
+
 
+async def stream_job_statuses(job_ids: List[str]):
+    """
+    Yield job status transitions pushed by the backend over SSE.
 
-async def get_invoices() -> Dict[str, Any]:
-    """Get all invoices."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/invoices")
+    The stream ends when every requested job reaches a terminal state,
+    so callers only see O(transitions) events instead of polling.
+    """
+    async with _get_client().stream(
+        "GET",
+        "/status/stream",
+        params={"ids": ",".join(job_ids)},
+        timeout=None,
+    ) as response:
         response.raise_for_status()
-        return response.json()
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                yield orjson.loads(line[len("data: "):])
+
+
+async def get_invoices(
+    search: Optional[str] = None,
+    limit: int = 100,
+    skip: int = 0,
+) -> Dict[str, Any]:
+    """Get invoices, optionally filtered server-side by a search term."""
+    params: Dict[str, Any] = {"limit": limit, "skip": skip}
+    if search:
+        params["search"] = search
+    response = await _get_client().get("/invoices", params=params)
+    return _decode(response)
+
+
+async def get_invoice_by_hash(pdf_hash: str) -> Optional[Dict[str, Any]]:
+    """Get the invoice already parsed from this file hash, or None."""
+    response = await _get_client().get(f"/invoices/by-hash/{pdf_hash}")
+    if response.status_code == 404:
+        return None
+    return _decode(response)
 
 
 async def get_vendors() -> Dict[str, Any]:
     """Get all vendors."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/vendors")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get("/vendors")
+    return _decode(response)
 
 
 async def get_monthly_analytics() -> Dict[str, Any]:
     """Get monthly analytics."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/analytics/monthly")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get("/analytics/monthly")
+    return _decode(response)
 
 
 async def get_top_vendors(limit: int = 10) -> Dict[str, Any]:
     """Get top vendors."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/analytics/top-vendors?limit={limit}")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(f"/analytics/top-vendors?limit={limit}")
+    return _decode(response)
 
 
 async def get_summary() -> Dict[str, Any]:
     """Get summary statistics."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/analytics/summary")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get("/analytics/summary")
+    return _decode(response)
+
+
+async def get_rollups() -> Dict[str, Any]:
+    """Get category/recurring/purchaser spending rollups computed in SQL."""
+    response = await _get_client().get("/analytics/rollups")
+    return _decode(response)
 
 
 async def send_chat_query(query: str) -> Dict[str, Any]:
     """Send chat query to API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{API_BASE_URL}/chat",
-            json={"query": query}
-        )
+    response = await _get_client().post("/chat", json={"query": query}, timeout=30.0)
+    return _decode(response)
+
+
+async def stream_chat_query(query: str):
+    """
+    Yield chat response events as the model generates them.
+
+    Events are {"delta": text} chunks followed by a final {"done": {...}}
+    payload matching send_chat_query's response shape.
+    """
+    async with _get_client().stream(
+        "POST",
+        "/chat/stream",
+        json={"query": query},
+        timeout=None,
+    ) as response:
         response.raise_for_status()
-        return response.json()
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                yield orjson.loads(line[len("data: "):])
 
 
 async def get_chat_history(limit: int = 50) -> Dict[str, Any]:
     """Get chat history."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{API_BASE_URL}/chat/history?limit={limit}")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(f"/chat/history?limit={limit}")
+    return _decode(response)
 
 
 def export_csv_url() -> str:
     """Get export CSV URL."""
     return f"{API_BASE_URL}/export/csv"
+
+
+# Streamlit-cached wrappers: pages rerun top to bottom on every widget
+# interaction, so these serve repeat reads from process memory instead of
+# refetching the full payload each time. Clear with st.cache_data.clear().
+
+@st.cache_data(ttl=30)
+def get_invoices_cached(
+    search: Optional[str] = None,
+    limit: int = 100,
+    skip: int = 0,
+) -> Dict[str, Any]:
+    """Cached snapshot of get_invoices, keyed by search/paging args (30s TTL)."""
+    return asyncio.run(get_invoices(search=search, limit=limit, skip=skip))
+
+
+@st.cache_data(ttl=60)
+def get_vendors_cached() -> Dict[str, Any]:
+    """Cached snapshot of get_vendors (60s TTL)."""
+    return asyncio.run(get_vendors())
+
+
+@st.cache_data(ttl=60)
+def get_summary_cached() -> Dict[str, Any]:
+    """Cached snapshot of get_summary (60s TTL)."""
+    return asyncio.run(get_summary())
+
+
+@st.cache_data(ttl=300)
+def get_chat_history_cached(limit: int = 50) -> Dict[str, Any]:
+    """Cached snapshot of get_chat_history (5 min TTL)."""
+    return asyncio.run(get_chat_history(limit=limit))
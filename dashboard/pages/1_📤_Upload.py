@@ -1,15 +1,179 @@
 import streamlit as st
 import asyncio
-import time
+import hashlib
 import sys
 import os
+import time
 
 # Add parent directory to path to import utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db_utils import upload_pdf, get_job_status
+from db_utils import upload_pdf, get_job_statuses, get_invoice_by_hash, stream_job_statuses
 
 st.set_page_config(page_title="Upload Invoices", page_icon="📤", layout="wide")
 
+POLL_INTERVAL_SECONDS = 2
+PROCESSING_TIMEOUT_SECONDS = 300
+
+
+async def _start_batch(files):
+    """
+    Hash-check and upload files under one long-lived event loop.
+
+    A single loop keeps the shared HTTP client's connections alive across
+    the dedupe gather and the upload gather, instead of paying loop and
+    connection-pool setup on each asyncio.run call. Returns the pending
+    job map plus the results recorded up front (cache hits).
+    """
+    results_summary = []
+
+    # Step 0: Skip files the server has already parsed, keyed by content hash.
+    # One SHA-256 is orders of magnitude cheaper than re-running extraction.
+    st.info("🔎 Checking for already-processed files...")
+    digests = [hashlib.sha256(f.getvalue()).hexdigest() for f in files]
+    cache_hits = await asyncio.gather(
+        *(get_invoice_by_hash(digest) for digest in digests),
+        return_exceptions=True
+    )
+
+    to_upload = []
+    for uploaded_file, hit in zip(files, cache_hits):
+        if isinstance(hit, dict):
+            results_summary.append({
+                "filename": uploaded_file.name,
+                "job_id": None,
+                "cached": True,
+                "result": {
+                    "parser_used": hit.get("parser_used", "cache"),
+                    "confidence": hit.get("confidence_score") or 0,
+                    "vendor": hit.get("vendor_normalized", "N/A")
+                }
+            })
+        else:
+            to_upload.append(uploaded_file)
+
+    if len(to_upload) < len(files):
+        st.info(f"📦 Skipped {len(files) - len(to_upload)} already-processed file(s)")
+
+    if not to_upload:
+        return {}, results_summary
+
+    # Step 1: Upload remaining files concurrently (wall time ~= slowest upload)
+    st.info("📤 Uploading files...")
+    upload_results = await asyncio.gather(
+        *(upload_pdf(f, f.name) for f in to_upload),
+        return_exceptions=True
+    )
+
+    name_by_job_id = {}
+    for uploaded_file, result in zip(to_upload, upload_results):
+        if isinstance(result, Exception):
+            st.error(f"❌ Error uploading {uploaded_file.name}: {str(result)}")
+        else:
+            name_by_job_id[result["job_id"]] = uploaded_file.name
+
+    if name_by_job_id:
+        st.success(f"✅ All {len(name_by_job_id)} files uploaded!")
+
+    return name_by_job_id, results_summary
+
+
+def _record_terminal_job(jobs, job_id: str, status_data: dict):
+    """Move a finished job from the pending map into upload_results."""
+    filename = jobs.pop(job_id)
+    if status_data["status"] == "complete":
+        entry = {
+            "filename": filename,
+            "job_id": job_id,
+            "result": status_data.get("result", {})
+        }
+    else:
+        entry = {
+            "filename": filename,
+            "job_id": job_id,
+            "error": status_data.get("error", "Unknown error")
+        }
+    st.session_state.upload_results.append(entry)
+
+
+async def _watch_stream(jobs, progress, info):
+    """Consume SSE status events, updating the progress placeholders."""
+    total = st.session_state.upload_total
+
+    async for event in stream_job_statuses(list(jobs)):
+        job_id = event["job_id"]
+        if job_id in jobs and event["status"] in ("complete", "error"):
+            _record_terminal_job(jobs, job_id, event)
+
+        completed = total - len(jobs)
+        progress.progress(completed / total if total else 1.0)
+        info.info(f"⚙️ Processing... {completed}/{total} complete")
+
+        if not jobs:
+            break
+
+
+def watch_status():
+    """
+    Watch pending jobs over the backend's SSE stream.
+
+    One long-lived request delivers O(transitions) events instead of one
+    batched poll per tick. Any stream failure flips this session to the
+    poll_status fragment, so monitoring still completes behind proxies
+    that buffer SSE; jobs already seen stay recorded either way.
+    """
+    jobs = st.session_state.get("upload_jobs", {})
+    if not jobs:
+        return
+
+    progress = st.progress(0.0)
+    info = st.empty()
+    info.info(f"⚙️ Processing... 0/{st.session_state.upload_total} complete")
+
+    try:
+        asyncio.run(_watch_stream(jobs, progress, info))
+    except Exception:
+        st.session_state.upload_use_polling = True
+        st.rerun(scope="app")
+
+    # Stream closed: every job is terminal (or the server's cap expired)
+    st.session_state.upload_jobs = {}
+    st.rerun(scope="app")
+
+
+@st.fragment(run_every=POLL_INTERVAL_SECONDS)
+def poll_status():
+    """
+    Poll pending jobs with one batched call per tick.
+
+    Fallback path when the SSE stream in watch_status fails. Runs as a
+    fragment, so each tick reruns only this block - the rest of the page
+    (including the Recent Processing Jobs fetch) stays untouched. Once
+    every job is terminal, a full-app rerun renders the final results.
+    """
+    jobs = st.session_state.get("upload_jobs", {})
+    if not jobs:
+        return
+
+    try:
+        statuses = asyncio.run(get_job_statuses(list(jobs)))["statuses"]
+    except Exception as e:
+        st.error(f"❌ Error checking job statuses: {str(e)}")
+        statuses = {}
+
+    for job_id, status_data in statuses.items():
+        if job_id in jobs and status_data["status"] in ("complete", "error"):
+            _record_terminal_job(jobs, job_id, status_data)
+
+    total = st.session_state.upload_total
+    completed = total - len(jobs)
+    st.progress(completed / total if total else 1.0)
+    st.info(f"⚙️ Processing... {completed}/{total} complete")
+
+    if not jobs or time.time() > st.session_state.upload_deadline:
+        st.session_state.upload_jobs = {}
+        st.rerun(scope="app")
+
+
 st.title("📤 Upload Invoices")
 st.markdown("Upload PDF invoices for processing through our AI-powered extraction pipeline.")
 
@@ -30,101 +194,54 @@ if uploaded_files:
             st.write(f"- {f.name} ({f.size / 1024:.1f} KB)")
 
     if st.button(f"🚀 Process {len(uploaded_files)} Invoice(s)", type="primary"):
-        st.markdown(f"### Processing {len(uploaded_files)} Invoice(s)")
-
-        # Create containers for overall progress
-        overall_progress = st.progress(0)
-        overall_status = st.empty()
-
-        job_ids = []
-        results_summary = []
-
-        # Step 1: Upload all files
-        overall_status.info("📤 Uploading files...")
-        for idx, uploaded_file in enumerate(uploaded_files):
-            try:
-                file_bytes = uploaded_file.read()
-                result = asyncio.run(upload_pdf(file_bytes, uploaded_file.name))
-                job_ids.append((uploaded_file.name, result["job_id"]))
-                overall_progress.progress((idx + 1) / len(uploaded_files) * 0.3)  # 30% for upload
-            except Exception as e:
-                st.error(f"❌ Error uploading {uploaded_file.name}: {str(e)}")
-
-        st.success(f"✅ All {len(job_ids)} files uploaded!")
-
-        # Step 2: Monitor processing
-        overall_status.info("⚙️ Processing invoices...")
-        completed = 0
-        max_attempts = 60
-
-        for attempt in range(max_attempts):
-            all_done = True
-
-            for file_name, job_id in job_ids:
-                try:
-                    status_data = asyncio.run(get_job_status(job_id))
-                    status = status_data["status"]
-
-                    if status in ["queued", "processing"]:
-                        all_done = False
-                    elif status == "complete":
-                        if job_id not in [r["job_id"] for r in results_summary]:
-                            completed += 1
-                            results_summary.append({
-                                "filename": file_name,
-                                "job_id": job_id,
-                                "result": status_data.get("result", {})
-                            })
-                            overall_progress.progress(0.3 + (completed / len(job_ids)) * 0.7)
-                    elif status == "error":
-                        if job_id not in [r["job_id"] for r in results_summary]:
-                            completed += 1
-                            results_summary.append({
-                                "filename": file_name,
-                                "job_id": job_id,
-                                "error": status_data.get("error", "Unknown error")
-                            })
-                            overall_progress.progress(0.3 + (completed / len(job_ids)) * 0.7)
-                except Exception as e:
-                    st.error(f"❌ Error checking status for {file_name}: {str(e)}")
-
-            if all_done:
-                break
-
-            overall_status.info(f"⚙️ Processing... {completed}/{len(job_ids)} complete")
-            time.sleep(2)
-
-        # Step 3: Display results
-        overall_status.success(f"✅ Processing complete! {completed}/{len(job_ids)} invoices processed")
-        overall_progress.progress(1.0)
-
-        st.markdown("### Results Summary")
-
-        # Show successful results
-        successful = [r for r in results_summary if "result" in r]
-        failed = [r for r in results_summary if "error" in r]
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("✅ Successful", len(successful))
-        with col2:
-            st.metric("❌ Failed", len(failed))
-
-        # Show details for each
-        for result in successful:
-            with st.expander(f"✅ {result['filename']}", expanded=False):
-                result_data = result["result"]
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Parser", result_data.get("parser_used", "N/A"))
-                with col2:
-                    st.metric("Confidence", f"{result_data.get('confidence', 0) * 100:.0f}%")
-                with col3:
-                    st.metric("Vendor", result_data.get("vendor", "N/A"))
-
-        for result in failed:
-            with st.expander(f"❌ {result['filename']}", expanded=False):
-                st.error(f"Error: {result['error']}")
+        # Dedupe + upload run here; monitoring is handed off to the
+        # poll_status fragment below
+        name_by_job_id, results_summary = asyncio.run(_start_batch(uploaded_files))
+
+        st.session_state.upload_jobs = name_by_job_id
+        st.session_state.upload_results = results_summary
+        st.session_state.upload_total = len(name_by_job_id)
+        st.session_state.upload_deadline = time.time() + PROCESSING_TIMEOUT_SECONDS
+        st.session_state.upload_use_polling = False
+
+if st.session_state.get("upload_jobs"):
+    st.markdown("### Processing Invoices")
+    if st.session_state.get("upload_use_polling"):
+        poll_status()
+    else:
+        watch_status()
+
+elif st.session_state.get("upload_results"):
+    results_summary = st.session_state.upload_results
+
+    # Step 3: Display results
+    st.markdown("### Results Summary")
+
+    # Show successful results
+    successful = [r for r in results_summary if "result" in r]
+    failed = [r for r in results_summary if "error" in r]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("✅ Successful", len(successful))
+    with col2:
+        st.metric("❌ Failed", len(failed))
+
+    # Show details for each
+    for result in successful:
+        with st.expander(f"✅ {result['filename']}", expanded=False):
+            result_data = result["result"]
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Parser", result_data.get("parser_used", "N/A"))
+            with col2:
+                st.metric("Confidence", f"{result_data.get('confidence', 0) * 100:.0f}%")
+            with col3:
+                st.metric("Vendor", result_data.get("vendor", "N/A"))
+
+    for result in failed:
+        with st.expander(f"❌ {result['filename']}", expanded=False):
+            st.error(f"Error: {result['error']}")
 
 st.markdown("---")
 
@@ -6,8 +6,16 @@ import os
 
 # Add parent directory to path to import utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db_utils import get_summary, get_monthly_analytics, get_top_vendors, get_vendors, get_invoices
-from utils.chart_builder import ChartBuilder
+from db_utils import get_summary, get_monthly_analytics, get_top_vendors, get_vendors, get_rollups
+from utils.chart_builder import (
+    COLORS,
+    create_category_bar_chart,
+    create_colored_bar_chart,
+    create_horizontal_bar_chart,
+    create_line_chart,
+    create_pie_chart,
+    create_simple_bar_chart,
+)
 
 # Add app directory to path to import formatters
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '..'))
@@ -15,14 +23,83 @@ from app.utils.formatters import format_currency
 
 st.set_page_config(page_title="Analytics", page_icon="📊", layout="wide")
 
+
+def _compute_aggregations(monthly_data, top_vendors_data, rollups, vendors_full):
+    """
+    Build the page's DataFrames from the fetched payloads.
+
+    The category/recurring/purchaser rollups arrive pre-aggregated from
+    /analytics/rollups, so this only wraps them in small DataFrames. Runs
+    in a worker thread via asyncio.to_thread so the remaining pandas work
+    doesn't block the Streamlit script thread.
+    """
+    agg = {}
+
+    if monthly_data['data']:
+        df_monthly = pd.DataFrame(monthly_data['data'])
+        # Dict form dispatches to the C assembly path - no per-row string
+        # build or dateutil parsing
+        df_monthly['date'] = pd.to_datetime(
+            dict(year=df_monthly['year'], month=df_monthly['month'], day=1)
+        )
+        agg['df_monthly'] = df_monthly.sort_values('date')
+
+    if top_vendors_data['vendors']:
+        agg['df_vendors'] = pd.DataFrame(top_vendors_data['vendors'])
+
+    if rollups['by_category']:
+        agg['category_spending'] = pd.DataFrame(rollups['by_category'])
+
+    if rollups['by_recurring']:
+        recurring_stats = pd.DataFrame(rollups['by_recurring'])
+        recurring_stats['type'] = recurring_stats['is_recurring'].apply(
+            lambda x: 'Recurring' if x else 'One-Time'
+        )
+        agg['recurring_stats'] = recurring_stats
+
+    if rollups['by_purchaser']:
+        agg['purchaser_stats'] = pd.DataFrame(rollups['by_purchaser'])
+
+    if vendors_full['vendors']:
+        df_all_vendors = pd.DataFrame(vendors_full['vendors'])
+
+        if 'category' in df_all_vendors.columns:
+            agg['category_stats'] = df_all_vendors.groupby('category').agg({
+                'total_spent': 'sum',
+                'invoice_count': 'sum'
+            }).reset_index()
+
+    return agg
+
+
+@st.cache_data(ttl=60)
+def _load_analytics_data():
+    """
+    Fetch all five independent analytics payloads concurrently and compute
+    the page aggregations off the main thread (60s TTL).
+    """
+    async def _fetch():
+        fetched = await asyncio.gather(
+            get_summary(),
+            get_monthly_analytics(),
+            get_top_vendors(limit=10),
+            get_rollups(),
+            get_vendors(),
+        )
+        agg = await asyncio.to_thread(_compute_aggregations, *fetched[1:])
+        return fetched, agg
+
+    return asyncio.run(_fetch())
+
 st.title("📊 Analytics Dashboard")
 st.markdown("Visualize spending trends, vendor metrics, and invoice insights.")
 
+if st.button("🔄 Refresh data"):
+    st.cache_data.clear()
+
 # Load data
 try:
-    summary = asyncio.run(get_summary())
-    monthly_data = asyncio.run(get_monthly_analytics())
-    top_vendors_data = asyncio.run(get_top_vendors(limit=10))
+    (summary, monthly_data, top_vendors_data, rollups, vendors_full), agg = _load_analytics_data()
 
     # KPI Cards
     st.markdown("### Key Metrics")
@@ -57,16 +134,11 @@ try:
     # Monthly Trend Chart
     st.markdown("### Monthly Spending Trend")
 
-    if monthly_data['data']:
-        df_monthly = pd.DataFrame(monthly_data['data'])
-        df_monthly['date'] = pd.to_datetime(
-            df_monthly['year'].astype(str) + '-' +
-            df_monthly['month'].astype(str) + '-01'
-        )
-        df_monthly = df_monthly.sort_values('date')
+    if 'df_monthly' in agg:
+        df_monthly = agg['df_monthly']
 
         # Spending line chart
-        fig_line = ChartBuilder.create_line_chart(
+        fig_line = create_line_chart(
             data=df_monthly,
             x='date',
             y='total',
@@ -78,7 +150,7 @@ try:
         st.plotly_chart(fig_line, use_container_width=True)
 
         # Invoice count bar chart
-        fig_count = ChartBuilder.create_simple_bar_chart(
+        fig_count = create_simple_bar_chart(
             data=df_monthly,
             x='date',
             y='count',
@@ -95,14 +167,13 @@ try:
     # Top Vendors
     st.markdown("### Top Vendors by Spending")
 
-    if top_vendors_data['vendors']:
+    if 'df_vendors' in agg:
+        df_vendors = agg['df_vendors']
         col1, col2 = st.columns(2)
 
         with col1:
             # Bar chart
-            df_vendors = pd.DataFrame(top_vendors_data['vendors'])
-
-            fig_vendors = ChartBuilder.create_horizontal_bar_chart(
+            fig_vendors = create_horizontal_bar_chart(
                 data=df_vendors,
                 x='total_spent',
                 y='normalized_name',
@@ -117,7 +188,7 @@ try:
 
         with col2:
             # Pie chart
-            fig_pie = ChartBuilder.create_pie_chart(
+            fig_pie = create_pie_chart(
                 data=df_vendors.head(5),
                 values='total_spent',
                 names='normalized_name',
@@ -128,12 +199,14 @@ try:
 
         # Vendor table
         st.markdown("#### Vendor Details")
-        df_vendors['total_spent'] = df_vendors['total_spent'].apply(format_currency)
         st.dataframe(
             df_vendors,
             column_config={
                 "normalized_name": "Vendor",
-                "total_spent": "Total Spent",
+                "total_spent": st.column_config.NumberColumn(
+                    "Total Spent",
+                    format="$%.2f"
+                ),
                 "invoice_count": "Invoices"
             },
             hide_index=True,
@@ -148,39 +221,26 @@ try:
     # Invoice Category Analytics
     st.markdown("### Spending by Category")
 
-    invoices_data = asyncio.run(get_invoices())
-    if invoices_data['invoices']:
-        df_invoices = pd.DataFrame(invoices_data['invoices'])
-
+    if rollups['by_category'] or rollups['by_recurring']:
         # Category breakdown
-        if 'category' in df_invoices.columns and 'total_amount' in df_invoices.columns:
-            # Convert total_amount to numeric if it's a string
-            if df_invoices['total_amount'].dtype == 'object':
-                df_invoices['total_amount'] = pd.to_numeric(df_invoices['total_amount'], errors='coerce')
-
-            category_spending = df_invoices.groupby('category').agg({
-                'total_amount': 'sum',
-                'id': 'count'
-            }).reset_index()
-            category_spending.columns = ['category', 'total_spent', 'invoice_count']
-            category_spending = category_spending.sort_values('total_spent', ascending=False)
-
+        if 'category_spending' in agg:
+            category_spending = agg['category_spending']
             col1, col2 = st.columns(2)
 
             with col1:
                 # Pie chart of spending by category
-                fig_cat_pie = ChartBuilder.create_pie_chart(
+                fig_cat_pie = create_pie_chart(
                     data=category_spending,
                     values='total_spent',
                     names='category',
                     title='Spending Distribution by Category',
-                    color_discrete_sequence=ChartBuilder.COLORS['qualitative']
+                    color_discrete_sequence=COLORS['qualitative']
                 )
                 st.plotly_chart(fig_cat_pie, use_container_width=True)
 
             with col2:
                 # Bar chart of spending by category
-                fig_cat_bar = ChartBuilder.create_colored_bar_chart(
+                fig_cat_bar = create_colored_bar_chart(
                     data=category_spending,
                     x='category',
                     y='total_spent',
@@ -191,12 +251,14 @@ try:
 
             # Category details table
             st.markdown("#### Category Breakdown")
-            category_spending['total_spent'] = category_spending['total_spent'].apply(format_currency)
             st.dataframe(
                 category_spending,
                 column_config={
                     "category": "Category",
-                    "total_spent": "Total Spent",
+                    "total_spent": st.column_config.NumberColumn(
+                        "Total Spent",
+                        format="$%.2f"
+                    ),
                     "invoice_count": "Invoice Count"
                 },
                 hide_index=True,
@@ -208,32 +270,24 @@ try:
         # Recurring vs One-Time Analysis
         st.markdown("### Recurring vs One-Time Purchases")
 
-        if 'is_recurring' in df_invoices.columns:
-            recurring_stats = df_invoices.groupby('is_recurring').agg({
-                'total_amount': 'sum',
-                'id': 'count'
-            }).reset_index()
-            recurring_stats.columns = ['is_recurring', 'total_spent', 'invoice_count']
-            recurring_stats['type'] = recurring_stats['is_recurring'].apply(
-                lambda x: 'Recurring' if x else 'One-Time'
-            )
-
+        if 'recurring_stats' in agg:
+            recurring_stats = agg['recurring_stats']
             col1, col2 = st.columns(2)
 
             with col1:
                 # Pie chart of recurring vs one-time
-                fig_recurring = ChartBuilder.create_pie_chart(
+                fig_recurring = create_pie_chart(
                     data=recurring_stats,
                     values='total_spent',
                     names='type',
                     title='Recurring vs One-Time Spending',
-                    color_discrete_map={'Recurring': ChartBuilder.COLORS['accent'], 'One-Time': ChartBuilder.COLORS['primary']}
+                    color_discrete_map={'Recurring': COLORS['accent'], 'One-Time': COLORS['primary']}
                 )
                 st.plotly_chart(fig_recurring, use_container_width=True)
 
             with col2:
                 # Bar comparison
-                fig_recurring_bar = ChartBuilder.create_category_bar_chart(
+                fig_recurring_bar = create_category_bar_chart(
                     data=recurring_stats,
                     x='type',
                     y='invoice_count',
@@ -247,43 +301,33 @@ try:
         # Purchaser Analytics (if purchaser data exists)
         st.markdown("### Spending by Purchaser")
 
-        if 'purchaser' in df_invoices.columns:
-            # Filter out None/null purchasers
-            df_with_purchaser = df_invoices[df_invoices['purchaser'].notna() & (df_invoices['purchaser'] != '')]
-
-            if not df_with_purchaser.empty:
-                purchaser_stats = df_with_purchaser.groupby('purchaser').agg({
-                    'total_amount': 'sum',
-                    'id': 'count'
-                }).reset_index()
-                purchaser_stats.columns = ['purchaser', 'total_spent', 'invoice_count']
-                purchaser_stats = purchaser_stats.sort_values('total_spent', ascending=False)
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    # Bar chart of spending by purchaser
-                    fig_purchaser = ChartBuilder.create_colored_bar_chart(
-                        data=purchaser_stats,
-                        x='purchaser',
-                        y='total_spent',
-                        title='Spending by Purchaser',
-                        color_by='total_spent',
-                        color_scale='Greens'
-                    )
-                    st.plotly_chart(fig_purchaser, use_container_width=True)
-
-                with col2:
-                    # Pie chart for purchaser distribution
-                    fig_purchaser_pie = ChartBuilder.create_pie_chart(
-                        data=purchaser_stats,
-                        values='total_spent',
-                        names='purchaser',
-                        title='Spending Distribution by Purchaser'
-                    )
-                    st.plotly_chart(fig_purchaser_pie, use_container_width=True)
-            else:
-                st.info("No purchaser information available in invoices.")
+        if 'purchaser_stats' in agg:
+            purchaser_stats = agg['purchaser_stats']
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Bar chart of spending by purchaser
+                fig_purchaser = create_colored_bar_chart(
+                    data=purchaser_stats,
+                    x='purchaser',
+                    y='total_spent',
+                    title='Spending by Purchaser',
+                    color_by='total_spent',
+                    color_scale='Greens'
+                )
+                st.plotly_chart(fig_purchaser, use_container_width=True)
+
+            with col2:
+                # Pie chart for purchaser distribution
+                fig_purchaser_pie = create_pie_chart(
+                    data=purchaser_stats,
+                    values='total_spent',
+                    names='purchaser',
+                    title='Spending Distribution by Purchaser'
+                )
+                st.plotly_chart(fig_purchaser_pie, use_container_width=True)
+        else:
+            st.info("No purchaser information available in invoices.")
 
     else:
         st.info("No invoice data available for category analytics.")
@@ -293,37 +337,28 @@ try:
     # Category breakdown (if categories exist)
     st.markdown("### Vendor Categories")
 
-    vendors_full = asyncio.run(get_vendors())
-    if vendors_full['vendors']:
-        df_all_vendors = pd.DataFrame(vendors_full['vendors'])
-
-        # Count by category
-        if 'category' in df_all_vendors.columns:
-            category_stats = df_all_vendors.groupby('category').agg({
-                'total_spent': 'sum',
-                'invoice_count': 'sum'
-            }).reset_index()
-
-            col1, col2 = st.columns(2)
+    if 'category_stats' in agg:
+        category_stats = agg['category_stats']
+        col1, col2 = st.columns(2)
 
-            with col1:
-                fig_cat = ChartBuilder.create_pie_chart(
-                    data=category_stats,
-                    values='total_spent',
-                    names='category',
-                    title='Spending by Category'
-                )
-                st.plotly_chart(fig_cat, use_container_width=True)
+        with col1:
+            fig_cat = create_pie_chart(
+                data=category_stats,
+                values='total_spent',
+                names='category',
+                title='Spending by Category'
+            )
+            st.plotly_chart(fig_cat, use_container_width=True)
 
-            with col2:
-                fig_cat_bar = ChartBuilder.create_category_bar_chart(
-                    data=category_stats,
-                    x='category',
-                    y='invoice_count',
-                    title='Invoice Count by Category',
-                    color_by='category'
-                )
-                st.plotly_chart(fig_cat_bar, use_container_width=True)
+        with col2:
+            fig_cat_bar = create_category_bar_chart(
+                data=category_stats,
+                x='category',
+                y='invoice_count',
+                title='Invoice Count by Category',
+                color_by='category'
+            )
+            st.plotly_chart(fig_cat_bar, use_container_width=True)
 
 except Exception as e:
     st.error(f"Error loading analytics: {e}")
@@ -5,7 +5,7 @@ import os
 
 # Add parent directory to path to import utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db_utils import send_chat_query, get_chat_history
+from db_utils import send_chat_query, stream_chat_query, get_chat_history_cached
 
 st.set_page_config(page_title="AI Chat", page_icon="💬", layout="wide")
 
@@ -16,13 +16,19 @@ st.markdown("Ask natural language questions about your invoices. Powered by **NE
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Load chat history from database on first load
-if "loaded_history" not in st.session_state:
+# Load chat history lazily: once per session, from the 5-minute cache.
+# Bump history_version to force a reload from the backend.
+if "history_version" not in st.session_state:
+    st.session_state.history_version = 0
+
+if st.session_state.get("loaded_history_version") != st.session_state.history_version:
     try:
-        history_data = asyncio.run(get_chat_history(limit=10))
+        history_data = get_chat_history_cached(limit=10)
         conversations = history_data.get("conversations", [])
 
-        # Add to session state (reverse to show oldest first)
+        # Rebuild from history (reverse to show oldest first) so reruns
+        # never re-append already-loaded messages
+        st.session_state.messages = []
         for conv in reversed(conversations):
             st.session_state.messages.append({
                 "role": "user",
@@ -33,11 +39,10 @@ if "loaded_history" not in st.session_state:
                 "content": conv["response"],
                 "completion_id": conv.get("completion_id")
             })
-
-        st.session_state.loaded_history = True
     except Exception as e:
-        st.session_state.loaded_history = True
         st.warning(f"Could not load chat history: {e}")
+    finally:
+        st.session_state.loaded_history_version = st.session_state.history_version
 
 # Display chat messages
 for message in st.session_state.messages:
@@ -67,7 +72,22 @@ if prompt := st.chat_input("Ask a question about your invoices..."):
         message_placeholder.markdown("Thinking...")
 
         try:
-            response_data = asyncio.run(send_chat_query(prompt))
+            # Render tokens as they arrive instead of waiting for the
+            # full generation
+            response_data = {}
+
+            async def _stream_response():
+                text = ""
+                async for event in stream_chat_query(prompt):
+                    if "delta" in event:
+                        text += event["delta"]
+                        message_placeholder.markdown(text + "▌")
+                    elif "done" in event:
+                        response_data.update(event["done"])
+                    elif "error" in event:
+                        raise Exception(event["error"])
+
+            asyncio.run(_stream_response())
 
             # Display response
             message_placeholder.markdown(response_data["response"])
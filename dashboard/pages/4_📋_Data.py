@@ -1,22 +1,24 @@
 import streamlit as st
-import asyncio
 import pandas as pd
 import sys
 import os
 
 # Add parent directory to path to import utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db_utils import get_invoices, get_vendors, export_csv_url
+from db_utils import get_invoices_cached, get_vendors_cached, export_csv_url
+from utils import _coerce_invoices
 
 # Add app directory to path to import formatters
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '..'))
-from app.utils.formatters import format_currency
 
 st.set_page_config(page_title="Data Browser", page_icon="📋", layout="wide")
 
 st.title("📋 Data Browser")
 st.markdown("Browse, search, and export your invoice data.")
 
+if st.button("🔄 Refresh data"):
+    st.cache_data.clear()
+
 # Tabs for different views
 tab1, tab2 = st.tabs(["📄 Invoices", "🏢 Vendors"])
 
@@ -24,24 +26,27 @@ with tab1:
     st.markdown("### Invoice Data")
 
     try:
-        invoices_data = asyncio.run(get_invoices())
+        # Search and pagination run server-side; only the current page of
+        # matching rows is transferred
+        PAGE_SIZE = 50
+
+        search = st.text_input("🔍 Search invoices (vendor, invoice number, etc.)")
+        page = st.number_input("Page", min_value=1, value=1, step=1)
+
+        invoices_data = get_invoices_cached(
+            search=search or None,
+            limit=PAGE_SIZE,
+            skip=(page - 1) * PAGE_SIZE
+        )
         invoices = invoices_data.get("invoices", [])
+        total = invoices_data.get("total", 0)
 
         if invoices:
-            st.info(f"Total Invoices: {invoices_data.get('total', 0)}")
-
-            # Convert to DataFrame
-            df = pd.DataFrame(invoices)
-
-            # Add search
-            search = st.text_input("🔍 Search invoices (vendor, invoice number, etc.)")
+            total_pages = max(1, -(-total // PAGE_SIZE))
+            st.info(f"Total Invoices: {total} (page {page} of {total_pages})")
 
-            if search:
-                mask = df.apply(lambda row: row.astype(str).str.contains(search, case=False).any(), axis=1)
-                df = df[mask]
-
-            # Format currency
-            df['total_amount'] = df['total_amount'].apply(format_currency)
+            # Convert to DataFrame with an explicit schema
+            df = _coerce_invoices(invoices)
 
             # Display table with new business intelligence fields
             st.dataframe(
@@ -60,7 +65,10 @@ with tab1:
                     "vendor_normalized": "Vendor",
                     "invoice_number": "Invoice #",
                     "date": "Date",
-                    "total_amount": "Amount",
+                    "total_amount": st.column_config.NumberColumn(
+                        "Amount",
+                        format="$%.2f"
+                    ),
                     "category": "Category",
                     "purchaser": "Purchaser",
                     "is_recurring": st.column_config.CheckboxColumn(
@@ -91,7 +99,7 @@ with tab2:
     st.markdown("### Vendor Data")
 
     try:
-        vendors_data = asyncio.run(get_vendors())
+        vendors_data = get_vendors_cached()
         vendors = vendors_data.get("vendors", [])
 
         if vendors:
@@ -102,12 +110,13 @@ with tab2:
             search_vendor = st.text_input("🔍 Search vendors")
 
             if search_vendor:
-                mask = df_vendors['normalized_name'].str.contains(search_vendor, case=False)
+                # regex=False skips the per-call regex compile; na=False skips
+                # slow NaN handling
+                mask = df_vendors['normalized_name'].str.contains(
+                    search_vendor, case=False, regex=False, na=False
+                )
                 df_vendors = df_vendors[mask]
 
-            # Format currency
-            df_vendors['total_spent'] = df_vendors['total_spent'].apply(format_currency)
-
             # Sort by total spent
             df_vendors = df_vendors.sort_values('invoice_count', ascending=False)
 
@@ -124,7 +133,10 @@ with tab2:
                 column_config={
                     "normalized_name": "Vendor",
                     "category": "Category",
-                    "total_spent": "Total Spent",
+                    "total_spent": st.column_config.NumberColumn(
+                        "Total Spent",
+                        format="$%.2f"
+                    ),
                     "invoice_count": "Invoices",
                     "first_seen": "First Seen",
                     "last_seen": "Last Seen"
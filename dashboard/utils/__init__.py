@@ -4,6 +4,52 @@ Dashboard utilities package.
 Contains reusable components for building dashboards.
 """
 
-from .chart_builder import ChartBuilder
+import pandas as pd
 
-__all__ = ['ChartBuilder']
+from .chart_builder import (
+    COLORS,
+    ChartBuilder,
+    create_bar_chart,
+    create_category_bar_chart,
+    create_colored_bar_chart,
+    create_horizontal_bar_chart,
+    create_line_chart,
+    create_pie_chart,
+    create_simple_bar_chart,
+)
+
+__all__ = [
+    'COLORS',
+    'ChartBuilder',
+    'create_bar_chart',
+    'create_category_bar_chart',
+    'create_colored_bar_chart',
+    'create_horizontal_bar_chart',
+    'create_line_chart',
+    'create_pie_chart',
+    'create_simple_bar_chart',
+]
+
+# Explicit column schema for invoice rows coming back from the API.
+# Category dtype stores each repeated string once, which shrinks memory
+# 5-10x on columns like category/parser_used.
+_INVOICE_DTYPES = {
+    'total_amount': 'float64',
+    'confidence_score': 'float64',
+    'is_recurring': 'boolean',
+    'category': 'category',
+    'parser_used': 'category',
+}
+
+
+def _coerce_invoices(rows) -> pd.DataFrame:
+    """
+    Build an invoice DataFrame with the correct dtypes in one pass.
+
+    Replaces the probe-then-coerce pattern (check dtype == 'object', then
+    pd.to_numeric) with a single schema-aware astype, so amounts arrive
+    as float64 regardless of how the API serialized them.
+    """
+    df = pd.DataFrame.from_records(rows)
+    dtypes = {col: dtype for col, dtype in _INVOICE_DTYPES.items() if col in df.columns}
+    return df.astype(dtypes) if dtypes else df
@@ -3,321 +3,558 @@ Chart builder utilities for creating consistent, reusable Plotly visualizations.
 
 Provides standardized chart creation functions to eliminate duplicate code
 and ensure consistent styling across the analytics dashboard.
+
+Factories emit plain figure-spec dicts ({"data": [...], "layout": {...}})
+rather than go.Figure/px objects: the dicts serialize identically but skip
+Plotly's per-property validation walk, which dominates construction cost
+on hot dashboard renders. st.plotly_chart accepts the dicts directly.
+
+Input frames should be built column-wise (dict-of-columns, from_records,
+or a transposed 2D array) so each column extraction here is a contiguous
+copy rather than a strided gather across a row-major block.
+
+Factories are module-level functions; calls resolve through a plain module
+attribute lookup instead of walking the class MRO and unwrapping a
+staticmethod descriptor on every chart render. ChartBuilder remains as a
+thin namespace shim for existing call sites.
 """
 
-import plotly.express as px
-import plotly.graph_objects as go
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
 from typing import Dict, Any, Optional, List
 
 
-class ChartBuilder:
-    """Factory class for creating standardized Plotly charts."""
-
-    # Default color schemes
-    COLORS = {
-        'primary': '#1f77b4',
-        'secondary': '#2ca02c',
-        'accent': '#ff7f0e',
-        'blues': 'Blues',
-        'greens': 'Greens',
-        'qualitative': px.colors.qualitative.Set3
+# Plotly is only needed to serialize specs in get_figure_json; the dict
+# factories never touch it. Importing it lazily keeps Plotly's ~200ms
+# package init off the dashboard's cold-start path.
+_pio = None
+
+
+def _get_pio():
+    """Import plotly.io on first use and configure the orjson engine."""
+    global _pio
+    if _pio is None:
+        import plotly.io as pio
+        # Serialize figures through orjson's C-level encoder (with native
+        # NumPy handling) instead of Plotly's pure-Python walk; 3-10x
+        # faster for charts beyond a few hundred points.
+        pio.json.config.default_engine = "orjson"
+        _pio = pio
+    return _pio
+
+
+# Default color schemes
+COLORS = {
+    'primary': '#1f77b4',
+    'secondary': '#2ca02c',
+    'accent': '#ff7f0e',
+    'blues': 'Blues',
+    'greens': 'Greens',
+    # px.colors.qualitative.Set3, inlined so the module doesn't pay
+    # the plotly.express (and transitively pandas-helpers) import
+    'qualitative': [
+        'rgb(141,211,199)', 'rgb(255,255,179)', 'rgb(190,186,218)',
+        'rgb(251,128,114)', 'rgb(128,177,211)', 'rgb(253,180,98)',
+        'rgb(179,222,105)', 'rgb(252,205,229)', 'rgb(217,217,217)',
+        'rgb(188,128,189)', 'rgb(204,235,197)', 'rgb(255,237,111)'
+    ]
+}
+
+
+def _hash_df(df: pd.DataFrame) -> int:
+    """Fast content hash of a DataFrame for cache keys."""
+    return hash(pd.util.hash_pandas_object(df).values.tobytes())
+
+
+def _extract(data, *cols):
+    """Materialize the requested columns as NumPy arrays in one pass.
+
+    Each factory pulls its columns exactly once up front, and traces carry
+    ndarrays - orjson serializes those natively, avoiding the Series ->
+    list-of-Python-scalars coercion Plotly does by default.
+    """
+    if isinstance(data, pd.DataFrame):
+        return tuple(data[c].to_numpy() for c in cols)
+    return tuple(np.asarray(data[c]) for c in cols)
+
+
+# Series longer than this are downsampled before rendering; the browser
+# only ever has to draw ~2k points regardless of underlying row count.
+_DOWNSAMPLE_THRESHOLD = 2000
+
+
+def _lttb_downsample(x, y, n_out: int):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Picks the point per bucket that preserves the most visual detail
+    (the one forming the largest triangle with the previously selected
+    point and the next bucket's centroid). Endpoints are always kept.
+    """
+    n = len(x)
+    if n <= n_out:
+        return x, y
+
+    x_num = np.asarray(x)
+    if x_num.dtype.kind in 'mM':  # datetimes -> numeric
+        x_num = x_num.astype('int64')
+    x_num = x_num.astype('float64')
+    y_num = np.asarray(y, dtype='float64')
+
+    # Bucket edges over the interior points; first/last stay fixed
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x_num[hi:next_hi].mean() if hi < next_hi else x_num[-1]
+        avg_y = y_num[hi:next_hi].mean() if hi < next_hi else y_num[-1]
+
+        areas = np.abs(
+            (x_num[anchor] - avg_x) * (y_num[lo:hi] - y_num[anchor])
+            - (x_num[anchor] - x_num[lo:hi]) * (avg_y - y_num[anchor])
+        )
+        anchor = lo + int(np.argmax(areas))
+        selected[i + 1] = anchor
+
+    return x[selected], y[selected]
+
+
+# Figure construction allocates thousands of dicts per chart, so cache
+# built figures keyed by a fast content hash of the input DataFrame.
+# On unchanged data (most reruns) the cached figure spec is reused and
+# only st.plotly_chart serialization runs.
+_DF_HASH_FUNCS = {pd.DataFrame: _hash_df}
+
+
+def _bar_spec(
+    traces: List[Dict[str, Any]],
+    title: str,
+    xaxis_title: str,
+    yaxis_title: str,
+    height: int,
+    show_legend: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Assemble a bar figure spec from prepared traces.
+
+    Single code path shared by every bar factory, so the dict-spec and
+    serialization optimizations apply uniformly.
+    """
+    layout = {
+        "title": {"text": title},
+        "xaxis": {"title": {"text": xaxis_title}},
+        "yaxis": {"title": {"text": yaxis_title}},
+        "height": height
+    }
+    if show_legend is not None:
+        layout["showlegend"] = show_legend
+
+    return {"data": traces, "layout": layout}
+
+
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_line_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    xaxis_title: str = "",
+    yaxis_title: str = "",
+    height: int = 400,
+    color: str = COLORS['primary'],
+    line_width: int = 3,
+    marker_size: int = 8,
+    downsample: bool = True
+) -> Dict[str, Any]:
+    """
+    Create a line chart with markers.
+
+    Args:
+        data: DataFrame or dict with data
+        x: Column name for x-axis
+        y: Column name for y-axis
+        title: Chart title
+        xaxis_title: X-axis label
+        yaxis_title: Y-axis label
+        height: Chart height in pixels
+        color: Line color
+        line_width: Width of line
+        marker_size: Size of markers
+        downsample: LTTB-downsample series beyond ~2k points
+
+    Returns:
+        Plotly figure spec dict
+    """
+    xs, ys = _extract(data, x, y)
+    if downsample and len(xs) > _DOWNSAMPLE_THRESHOLD:
+        xs, ys = _lttb_downsample(xs, ys, _DOWNSAMPLE_THRESHOLD)
+
+    return {
+        "data": [{
+            "type": "scatter",
+            "x": xs,
+            "y": ys,
+            "mode": "lines+markers",
+            "name": title,
+            "line": {"color": color, "width": line_width},
+            "marker": {"size": marker_size}
+        }],
+        "layout": {
+            "title": {"text": title},
+            "xaxis": {"title": {"text": xaxis_title or x.title()}},
+            "yaxis": {"title": {"text": yaxis_title or y.title()}},
+            "hovermode": "x unified",
+            "height": height
+        }
     }
 
-    @staticmethod
-    def create_line_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        xaxis_title: str = "",
-        yaxis_title: str = "",
-        height: int = 400,
-        color: str = COLORS['primary'],
-        line_width: int = 3,
-        marker_size: int = 8
-    ) -> go.Figure:
-        """
-        Create a line chart with markers.
-
-        Args:
-            data: DataFrame or dict with data
-            x: Column name for x-axis
-            y: Column name for y-axis
-            title: Chart title
-            xaxis_title: X-axis label
-            yaxis_title: Y-axis label
-            height: Chart height in pixels
-            color: Line color
-            line_width: Width of line
-            marker_size: Size of markers
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=data[x],
-            y=data[y],
-            mode='lines+markers',
-            name=title,
-            line=dict(color=color, width=line_width),
-            marker=dict(size=marker_size)
-        ))
-
-        fig.update_layout(
-            title=title,
-            xaxis_title=xaxis_title or x.title(),
-            yaxis_title=yaxis_title or y.title(),
-            hovermode='x unified',
-            height=height
-        )
 
-        return fig
-
-    @staticmethod
-    def create_bar_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        orientation: str = 'v',
-        color: Optional[str] = None,
-        color_continuous_scale: str = 'Blues',
-        xaxis_title: str = "",
-        yaxis_title: str = "",
-        height: int = 400,
-        show_legend: bool = False
-    ) -> go.Figure:
-        """
-        Create a bar chart.
-
-        Args:
-            data: DataFrame with data
-            x: Column name for x-axis (or y-axis if horizontal)
-            y: Column name for y-axis (or x-axis if horizontal)
-            title: Chart title
-            orientation: 'v' for vertical, 'h' for horizontal
-            color: Column name to color by (optional)
-            color_continuous_scale: Color scale to use
-            xaxis_title: X-axis label
-            yaxis_title: Y-axis label
-            height: Chart height in pixels
-            show_legend: Whether to show legend
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = px.bar(
-            data,
-            x=x,
-            y=y,
-            orientation=orientation,
-            title=title,
-            labels={x: xaxis_title or x.title(), y: yaxis_title or y.title()},
-            color=color,
-            color_continuous_scale=color_continuous_scale if color else None
-        )
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_bar_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    orientation: str = 'v',
+    color: Optional[str] = None,
+    color_continuous_scale: str = 'Blues',
+    xaxis_title: str = "",
+    yaxis_title: str = "",
+    height: int = 400,
+    show_legend: bool = False
+) -> Dict[str, Any]:
+    """
+    Create a bar chart.
+
+    Args:
+        data: DataFrame with data
+        x: Column name for x-axis (or y-axis if horizontal)
+        y: Column name for y-axis (or x-axis if horizontal)
+        title: Chart title
+        orientation: 'v' for vertical, 'h' for horizontal
+        color: Column name to color by (optional)
+        color_continuous_scale: Color scale to use
+        xaxis_title: X-axis label
+        yaxis_title: Y-axis label
+        height: Chart height in pixels
+        show_legend: Whether to show legend
+
+    Returns:
+        Plotly figure spec dict
+    """
+    x_arr, y_arr = _extract(data, x, y)
+    trace = {
+        "type": "bar",
+        "x": x_arr,
+        "y": y_arr,
+        "orientation": orientation
+    }
 
-        fig.update_layout(height=height, showlegend=show_legend)
-
-        return fig
-
-    @staticmethod
-    def create_pie_chart(
-        data,
-        values: str,
-        names: str,
-        title: str,
-        height: int = 400,
-        color_discrete_sequence: Optional[List[str]] = None,
-        color_discrete_map: Optional[Dict[str, str]] = None,
-        show_percent: bool = True
-    ) -> go.Figure:
-        """
-        Create a pie chart.
-
-        Args:
-            data: DataFrame with data
-            values: Column name for values
-            names: Column name for labels
-            title: Chart title
-            height: Chart height in pixels
-            color_discrete_sequence: List of colors to use
-            color_discrete_map: Dict mapping labels to specific colors
-            show_percent: Whether to show percentages on slices
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = px.pie(
-            data,
-            values=values,
-            names=names,
-            title=title,
-            color_discrete_sequence=color_discrete_sequence,
-            color_discrete_map=color_discrete_map
-        )
+    if color is not None:
+        # Continuous gradient, matching px.bar with a numeric color column
+        (color_arr,) = _extract(data, color)
+        trace["marker"] = {
+            "color": color_arr,
+            "colorscale": color_continuous_scale,
+            "colorbar": {"title": {"text": color.title()}}
+        }
+
+    return _bar_spec(
+        [trace],
+        title,
+        xaxis_title or x.title(),
+        yaxis_title or y.title(),
+        height,
+        show_legend=show_legend
+    )
+
+
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_pie_chart(
+    data,
+    values: str,
+    names: str,
+    title: str,
+    height: int = 400,
+    color_discrete_sequence: Optional[List[str]] = None,
+    color_discrete_map: Optional[Dict[str, str]] = None,
+    show_percent: bool = True
+) -> Dict[str, Any]:
+    """
+    Create a pie chart.
+
+    Args:
+        data: DataFrame with data
+        values: Column name for values
+        names: Column name for labels
+        title: Chart title
+        height: Chart height in pixels
+        color_discrete_sequence: List of colors to use
+        color_discrete_map: Dict mapping labels to specific colors
+        show_percent: Whether to show percentages on slices
+
+    Returns:
+        Plotly figure spec dict
+    """
+    values_arr, labels_arr = _extract(data, values, names)
+    trace = {
+        "type": "pie",
+        "values": values_arr,
+        "labels": labels_arr
+    }
 
-        if show_percent:
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-
-        fig.update_layout(height=height)
-
-        return fig
-
-    @staticmethod
-    def create_horizontal_bar_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        color: Optional[str] = None,
-        color_continuous_scale: str = 'Blues',
-        height: int = 500,
-        xaxis_title: str = "",
-        yaxis_title: str = ""
-    ) -> go.Figure:
-        """
-        Create a horizontal bar chart (convenience wrapper).
-
-        Args:
-            data: DataFrame with data
-            x: Column name for x-axis (values)
-            y: Column name for y-axis (categories)
-            title: Chart title
-            color: Column name to color by (optional)
-            color_continuous_scale: Color scale to use
-            height: Chart height in pixels
-            xaxis_title: X-axis label
-            yaxis_title: Y-axis label
-
-        Returns:
-            Plotly Figure object
-        """
-        return ChartBuilder.create_bar_chart(
-            data=data,
-            x=x,
-            y=y,
-            title=title,
-            orientation='h',
-            color=color,
-            color_continuous_scale=color_continuous_scale,
-            height=height,
-            xaxis_title=xaxis_title,
-            yaxis_title=yaxis_title,
-            show_legend=False
-        )
+    if color_discrete_map is not None:
+        trace["marker"] = {
+            "colors": [color_discrete_map.get(label) for label in labels_arr]
+        }
+    elif color_discrete_sequence is not None:
+        trace["marker"] = {"colors": color_discrete_sequence}
+
+    if show_percent:
+        trace["textposition"] = "inside"
+        trace["textinfo"] = "percent+label"
+    else:
+        # Plotly's default textinfo is "percent"; opt out explicitly
+        trace["textposition"] = "none"
+        trace["textinfo"] = "none"
+
+    return {
+        "data": [trace],
+        "layout": {
+            "title": {"text": title},
+            "height": height
+        }
+    }
 
-    @staticmethod
-    def create_simple_bar_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        bar_color: str = COLORS['secondary'],
-        height: int = 300
-    ) -> go.Figure:
-        """
-        Create a simple bar chart with uniform color.
-
-        Args:
-            data: DataFrame with data
-            x: Column name for x-axis
-            y: Column name for y-axis
-            title: Chart title
-            bar_color: Color for all bars
-            height: Chart height in pixels
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=data[x],
-            y=data[y],
-            name=title,
-            marker_color=bar_color
-        ))
-
-        fig.update_layout(
-            title=title,
-            xaxis_title=x.title(),
-            yaxis_title=y.title(),
-            height=height
-        )
 
-        return fig
-
-    @staticmethod
-    def create_colored_bar_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        color_by: str,
-        color_scale: str = 'Blues',
-        height: int = 400
-    ) -> go.Figure:
-        """
-        Create a bar chart with color gradient based on values.
-
-        Args:
-            data: DataFrame with data
-            x: Column name for x-axis
-            y: Column name for y-axis
-            title: Chart title
-            color_by: Column name to determine color intensity
-            color_scale: Plotly color scale name
-            height: Chart height in pixels
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = px.bar(
-            data,
-            x=x,
-            y=y,
-            title=title,
-            color=color_by,
-            color_continuous_scale=color_scale,
-            labels={x: x.title(), y: y.title()}
-        )
+def create_horizontal_bar_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    color: Optional[str] = None,
+    color_continuous_scale: str = 'Blues',
+    height: int = 500,
+    xaxis_title: str = "",
+    yaxis_title: str = ""
+) -> Dict[str, Any]:
+    """
+    Create a horizontal bar chart (convenience wrapper).
+
+    Args:
+        data: DataFrame with data
+        x: Column name for x-axis (values)
+        y: Column name for y-axis (categories)
+        title: Chart title
+        color: Column name to color by (optional)
+        color_continuous_scale: Color scale to use
+        height: Chart height in pixels
+        xaxis_title: X-axis label
+        yaxis_title: Y-axis label
+
+    Returns:
+        Plotly figure spec dict
+    """
+    return create_bar_chart(
+        data=data,
+        x=x,
+        y=y,
+        title=title,
+        orientation='h',
+        color=color,
+        color_continuous_scale=color_continuous_scale,
+        height=height,
+        xaxis_title=xaxis_title,
+        yaxis_title=yaxis_title,
+        show_legend=False
+    )
+
+
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_simple_bar_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    bar_color: str = COLORS['secondary'],
+    height: int = 300
+) -> Dict[str, Any]:
+    """
+    Create a simple bar chart with uniform color.
+
+    Args:
+        data: DataFrame with data
+        x: Column name for x-axis
+        y: Column name for y-axis
+        title: Chart title
+        bar_color: Color for all bars
+        height: Chart height in pixels
+
+    Returns:
+        Plotly figure spec dict
+    """
+    x_arr, y_arr = _extract(data, x, y)
+    trace = {
+        "type": "bar",
+        "x": x_arr,
+        "y": y_arr,
+        "name": title,
+        "marker": {"color": bar_color}
+    }
 
-        fig.update_layout(height=height, showlegend=False)
-
-        return fig
-
-    @staticmethod
-    def create_category_bar_chart(
-        data,
-        x: str,
-        y: str,
-        title: str,
-        color_by: str,
-        height: int = 400
-    ) -> go.Figure:
-        """
-        Create a bar chart with categorical colors.
-
-        Args:
-            data: DataFrame with data
-            x: Column name for x-axis
-            y: Column name for y-axis
-            title: Chart title
-            color_by: Column name for categorical colors
-            height: Chart height in pixels
-
-        Returns:
-            Plotly Figure object
-        """
-        fig = px.bar(
-            data,
-            x=x,
-            y=y,
-            title=title,
-            color=color_by
-        )
+    return _bar_spec([trace], title, x.title(), y.title(), height)
+
+
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_colored_bar_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    color_by: str,
+    color_scale: str = 'Blues',
+    height: int = 400
+) -> Dict[str, Any]:
+    """
+    Create a bar chart with color gradient based on values.
+
+    Args:
+        data: DataFrame with data
+        x: Column name for x-axis
+        y: Column name for y-axis
+        title: Chart title
+        color_by: Column name to determine color intensity
+        color_scale: Plotly color scale name
+        height: Chart height in pixels
+
+    Returns:
+        Plotly figure spec dict
+    """
+    x_arr, y_arr, color_arr = _extract(data, x, y, color_by)
+    trace = {
+        "type": "bar",
+        "x": x_arr,
+        "y": y_arr,
+        "marker": {
+            "color": color_arr,
+            "colorscale": color_scale,
+            "colorbar": {"title": {"text": color_by.title()}}
+        }
+    }
+
+    return _bar_spec(
+        [trace], title, x.title(), y.title(), height, show_legend=False
+    )
+
+
+@st.cache_resource(hash_funcs=_DF_HASH_FUNCS)
+def create_category_bar_chart(
+    data,
+    x: str,
+    y: str,
+    title: str,
+    color_by: str,
+    height: int = 400
+) -> Dict[str, Any]:
+    """
+    Create a bar chart with categorical colors.
+
+    Args:
+        data: DataFrame with data
+        x: Column name for x-axis
+        y: Column name for y-axis
+        title: Chart title
+        color_by: Column name for categorical colors
+        height: Chart height in pixels
+
+    Returns:
+        Plotly figure spec dict
+    """
+    # One trace per category in a single groupby pass; the layout
+    # colorway assigns each trace its color, matching px.bar
+    traces = [
+        dict(zip(("x", "y"), _extract(group, x, y)), type="bar", name=str(name))
+        for name, group in data.groupby(color_by, sort=False, observed=True)
+    ]
+
+    return _bar_spec(traces, title, x.title(), y.title(), height)
+
+
+def patch_line_chart_data(x_arr, y_arr) -> Dict[str, List[Any]]:
+    """
+    Build a Plotly restyle payload replacing a line chart's data.
+
+    Counterpart to create_line_chart for filter-style updates: build the
+    full spec once on first render, then apply this payload client-side
+    (Plotly.restyle / Dash Patch semantics) when only the data changes,
+    so the frontend diffs the trace instead of rebuilding the plot.
+
+    Args:
+        x_arr: New x values (array-like)
+        y_arr: New y values (array-like)
+
+    Returns:
+        Restyle dict with per-trace x/y lists
+    """
+    return {"x": [np.asarray(x_arr)], "y": [np.asarray(y_arr)]}
+
+
+# LRU of pre-serialized chart JSON, keyed by (method, data hash, args).
+# Hits skip both figure building and JSON encoding - the largest
+# per-request costs when serving chart payloads for repeated views.
+_JSON_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_JSON_CACHE_MAXSIZE = 128
+
+
+def get_figure_json(method: str, data, **kwargs) -> str:
+    """
+    Return a chart's serialized JSON, cached by input content.
+
+    Args:
+        method: Name of the create_* factory to invoke
+        data: DataFrame passed to the factory
+        **kwargs: Remaining factory arguments
+
+    Returns:
+        JSON string of the figure spec
+    """
+    key = (method, _hash_df(data), tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+
+    cached = _JSON_CACHE.get(key)
+    if cached is not None:
+        _JSON_CACHE.move_to_end(key)
+        return cached
+
+    spec = globals()[method](data, **kwargs)
+    rendered = _get_pio().to_json(spec, validate=False)
+
+    _JSON_CACHE[key] = rendered
+    if len(_JSON_CACHE) > _JSON_CACHE_MAXSIZE:
+        _JSON_CACHE.popitem(last=False)
+
+    return rendered
+
+
+class ChartBuilder:
+    """Backward-compatible namespace over the module-level chart factories."""
+
+    COLORS = COLORS
 
-        fig.update_layout(height=height)
+    _bar_spec = staticmethod(_bar_spec)
+    get_figure_json = staticmethod(get_figure_json)
+    patch_line_chart_data = staticmethod(patch_line_chart_data)
 
-        return fig
+    create_line_chart = staticmethod(create_line_chart)
+    create_bar_chart = staticmethod(create_bar_chart)
+    create_pie_chart = staticmethod(create_pie_chart)
+    create_horizontal_bar_chart = staticmethod(create_horizontal_bar_chart)
+    create_simple_bar_chart = staticmethod(create_simple_bar_chart)
+    create_colored_bar_chart = staticmethod(create_colored_bar_chart)
+    create_category_bar_chart = staticmethod(create_category_bar_chart)
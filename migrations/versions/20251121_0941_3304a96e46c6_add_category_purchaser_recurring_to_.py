@@ -17,18 +17,32 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add business intelligence fields to invoices table
-    op.add_column('invoices', sa.Column('category', sa.String(100), nullable=True, server_default='Other'))
-    op.add_column('invoices', sa.Column('purchaser', sa.String(100), nullable=True))
-    op.add_column('invoices', sa.Column('is_recurring', sa.Boolean(), nullable=True, server_default='false'))
-
-    # Create indexes for faster querying
-    op.create_index('ix_invoices_category', 'invoices', ['category'])
+    # Add business intelligence fields to invoices table.
+    # One ALTER TABLE so the AccessExclusiveLock is taken once for all
+    # three columns instead of per op.add_column statement.
+    op.execute(
+        'ALTER TABLE invoices '
+        "ADD COLUMN category VARCHAR(100) DEFAULT 'Other', "
+        'ADD COLUMN purchaser VARCHAR(100), '
+        'ADD COLUMN is_recurring BOOLEAN DEFAULT false'
+    )
+
+    # Partial index for category filters; CONCURRENTLY must run outside
+    # the transaction so the build doesn't block writes.
+    # category is low-cardinality and most rows sit in the 'Other' default,
+    # so excluding them keeps the index small and worth scanning for the
+    # dashboard's per-category queries.
+    op.execute('COMMIT')
+    op.execute(
+        'CREATE INDEX CONCURRENTLY ix_invoices_category '
+        "ON invoices (category) WHERE category <> 'Other'"
+    )
 
 
 def downgrade() -> None:
-    # Remove indexes
-    op.drop_index('ix_invoices_category', 'invoices')
+    # Remove indexes (CONCURRENTLY needs to run outside the transaction)
+    op.execute('COMMIT')
+    op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_invoices_category')
 
     # Remove columns
     op.drop_column('invoices', 'is_recurring')
@@ -23,15 +23,23 @@ def upgrade() -> None:
     # Add embedding column (1536 dimensions for OpenAI text-embedding-ada-002)
     op.execute('ALTER TABLE invoices ADD COLUMN embedding vector(1536)')
 
-    # Note: IVFFlat index requires data in the table before creation
-    # We'll create it manually later with:
-    # CREATE INDEX invoices_embedding_idx ON invoices USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
-    # For now, queries will use sequential scan (fine for <10K invoices)
+    # Build the HNSW index up front so similarity queries stay O(log N)
+    # instead of degrading to a full-table distance scan as rows grow.
+    # CONCURRENTLY cannot run inside a transaction, so end the migration
+    # transaction first; the generous maintenance_work_mem speeds the build.
+    op.execute('COMMIT')
+    op.execute("SET maintenance_work_mem = '1GB'")
+    op.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS invoices_embedding_idx '
+        'ON invoices USING hnsw (embedding vector_cosine_ops) '
+        'WITH (m = 16, ef_construction = 64)'
+    )
 
 
 def downgrade() -> None:
-    # Drop index first
-    op.execute('DROP INDEX IF EXISTS invoices_embedding_idx')
+    # Drop index first (CONCURRENTLY needs to run outside the transaction)
+    op.execute('COMMIT')
+    op.execute('DROP INDEX CONCURRENTLY IF EXISTS invoices_embedding_idx')
 
     # Drop column
     op.execute('ALTER TABLE invoices DROP COLUMN IF EXISTS embedding')
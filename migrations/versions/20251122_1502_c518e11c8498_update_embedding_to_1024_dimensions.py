@@ -17,14 +17,43 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Drop old 1536-dimension column
-    op.execute('ALTER TABLE invoices DROP COLUMN IF EXISTS embedding')
-
-    # Add new 1024-dimension column for BGE-Large
-    op.execute('ALTER TABLE invoices ADD COLUMN embedding vector(1024)')
+    # Don't queue behind long-running queries indefinitely
+    op.execute("SET lock_timeout = '5s'")
+
+    # Replace the 1536-dimension column with 1024 dimensions for BGE-Large.
+    # One ALTER TABLE so PostgreSQL takes the AccessExclusiveLock and plans
+    # the table rewrite once instead of per statement.
+    # halfvec (FP16) halves storage and scan bandwidth versus vector (FP32);
+    # BGE-Large embeddings tolerate FP16 within <0.5% recall loss.
+    op.execute(
+        'ALTER TABLE invoices '
+        'DROP COLUMN IF EXISTS embedding, '
+        'ADD COLUMN embedding halfvec(1024)'
+    )
+
+    # Rebuild the HNSW index (dropped with the old column) against the
+    # halfvec operator class; CONCURRENTLY must run outside the transaction
+    op.execute('COMMIT')
+    op.execute("SET maintenance_work_mem = '1GB'")
+    op.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS invoices_embedding_idx '
+        'ON invoices USING hnsw (embedding halfvec_cosine_ops) '
+        'WITH (m = 16, ef_construction = 64)'
+    )
 
 
 def downgrade() -> None:
-    # Revert back to 1536 dimensions
-    op.execute('ALTER TABLE invoices DROP COLUMN IF EXISTS embedding')
-    op.execute('ALTER TABLE invoices ADD COLUMN embedding vector(1536)')
+    # Revert back to 1536 FP32 dimensions (single lock window, as in upgrade)
+    op.execute("SET lock_timeout = '5s'")
+    op.execute(
+        'ALTER TABLE invoices '
+        'DROP COLUMN IF EXISTS embedding, '
+        'ADD COLUMN embedding vector(1536)'
+    )
+
+    op.execute('COMMIT')
+    op.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS invoices_embedding_idx '
+        'ON invoices USING hnsw (embedding vector_cosine_ops) '
+        'WITH (m = 16, ef_construction = 64)'
+    )
@@ -0,0 +1,31 @@
+"""add_parse_cache_timestamp_index
+
+Revision ID: 138a5d6bc965
+Revises: c518e11c8498
+Create Date: 2026-09-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '138a5d6bc965'
+down_revision = 'c518e11c8498'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index for TTL pruning of stale cache rows; CONCURRENTLY must run
+    # outside the transaction so the build doesn't block writes
+    op.execute('COMMIT')
+    op.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_parse_cache_timestamp '
+        'ON parse_cache (timestamp)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('COMMIT')
+    op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_parse_cache_timestamp')
@@ -0,0 +1,134 @@
+"""
+Dev harness for comparing NEAR AI models on sample invoice PDFs.
+
+Runs each model against each sample invoice and prints the extracted
+fields side by side, so prompt or model changes can be sanity-checked
+without going through the full upload pipeline.
+
+Usage:
+    python test_models.py invoice1.pdf [invoice2.pdf ...]
+"""
+
+import asyncio
+import json
+import re
+import sys
+import time
+
+import httpx
+import orjson
+import pdfplumber
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Compiled once at import; response parsing stays off the re-cache path
+_RE_MD_JSON = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+_RE_JSON_OBJ = re.compile(r'\{.*\}', re.DOTALL)
+
+MODELS = [
+    "deepseek-ai/DeepSeek-V3.1",
+    "zai-org/GLM-4.6",
+]
+
+PROMPT_TEMPLATE = """Extract invoice information from this text and return ONLY a valid JSON object with no additional text or markdown.
+
+Invoice Text:
+{pdf_text}
+
+Return ONLY this JSON format (no explanations, no markdown):
+{{
+    "vendor": "vendor name here",
+    "invoice_number": "invoice number or null",
+    "date": "MM/DD/YYYY or null",
+    "total_amount": 0.00
+}}"""
+
+
+def _extract_pdf_text(pdf_path: str) -> str:
+    """Extract text from all pages of a PDF."""
+    with pdfplumber.open(pdf_path) as pdf:
+        # join() is linear in total text size; += per page re-copies the
+        # accumulated buffer on every iteration
+        return "\n\n".join(page.extract_text() or "" for page in pdf.pages)
+
+
+def _parse_json_response(content: str) -> dict:
+    """Pull the JSON object out of a model response (markdown block or bare)."""
+    match = _RE_MD_JSON.search(content)
+    if match:
+        return orjson.loads(match.group(1))
+
+    match = _RE_JSON_OBJ.search(content)
+    if match:
+        return orjson.loads(match.group(0))
+
+    raise ValueError(f"No JSON object in response: {content[:200]}")
+
+
+async def test_model(client: httpx.AsyncClient, model: str, pdf_path: str, name: str) -> dict:
+    """Run one model against one invoice and return the extracted fields."""
+    pdf_text = _extract_pdf_text(pdf_path)
+
+    start = time.perf_counter()
+    response = await client.post(
+        f"{settings.NEAR_AI_BASE_URL}/v1/chat/completions",
+        headers={"Authorization": f"Bearer {settings.NEAR_AI_API_KEY}"},
+        json={
+            "model": model,
+            "messages": [{"role": "user", "content": PROMPT_TEMPLATE.format(pdf_text=pdf_text)}],
+            "temperature": 0.1,
+            "max_tokens": 1000,
+        },
+    )
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+
+    content = orjson.loads(response.content)["choices"][0]["message"]["content"].strip()
+    extracted = _parse_json_response(content)
+    extracted["_elapsed_seconds"] = round(elapsed, 2)
+
+    print(f"  {model} / {name}: {extracted.get('vendor')} "
+          f"${extracted.get('total_amount')} ({elapsed:.1f}s)")
+    return extracted
+
+
+# Dev harness, not a pytest case - keep collection away from it
+test_model.__test__ = False
+
+
+async def main() -> None:
+    invoices = [(path.rsplit('/', 1)[-1], path) for path in sys.argv[1:]]
+    if not invoices:
+        print("Usage: python test_models.py <invoice.pdf> [...]")
+        sys.exit(1)
+
+    # One client for the whole run: TCP/TLS setup is paid once and the
+    # concurrent requests multiplex over the pooled connections
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(max_connections=8),
+    ) as client:
+        # Every (model, invoice) pair is independent, so run the whole
+        # matrix concurrently: wall time ~= slowest single request
+        keys = [(model, name) for model in MODELS for name, _ in invoices]
+        flat_results = await asyncio.gather(
+            *(test_model(client, model, path, name)
+              for model in MODELS for name, path in invoices),
+            return_exceptions=True,
+        )
+
+    results = {model: {} for model in MODELS}
+    for (model, name), result in zip(keys, flat_results):
+        if isinstance(result, Exception):
+            results[model][name] = {"error": str(result)}
+        else:
+            results[model][name] = result
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
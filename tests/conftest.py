@@ -6,7 +6,64 @@ Configures the test environment and provides common fixtures.
 
 import sys
 import os
+import types
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
 import pytest
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Stub out sentence_transformers before anything imports it: unit tests
+# only ever exercise mocked models, and importing the real package drags
+# the full torch stack into collection (plus a ~1.3GB model download on
+# first load).
+if "sentence_transformers" not in sys.modules:
+    _stub = types.ModuleType("sentence_transformers")
+    _stub.SentenceTransformer = Mock(name="SentenceTransformer")
+    sys.modules["sentence_transformers"] = _stub
+
+# Shared BGE model mock, reconfigured per test by the fixture below.
+# encode returns a real ndarray so the service's .tolist() exercises the
+# C fast path instead of a Mock attribute lookup.
+_MOCK_BGE_MODEL = Mock(name="bge_model")
+_FAKE_EMBED = np.full(1024, 0.1, dtype=np.float32)
+
+
+@pytest.fixture(scope="session")
+def utils():
+    """
+    Shared namespace over the formatting and JSON parsing utilities.
+
+    Imported once per session so every test module reuses the same module
+    objects (and their lru_caches / compiled regexes) instead of repeating
+    the import block at the top of each file.
+    """
+    from app.utils import formatters, json_parser
+    return SimpleNamespace(**{
+        name: value
+        for module in (formatters, json_parser)
+        for name, value in vars(module).items()
+        if not name.startswith('_')
+    })
+
+
+@pytest.fixture
+def mock_bge_model(monkeypatch):
+    """
+    Route embedding generation at a mocked BGE model.
+
+    Selects the bge provider and swaps _get_bge_model for the shared
+    model mock (encode -> 1024-dim vector), replacing the patch() blocks
+    each embedding test used to set up individually. Tests receive the
+    mock so they can assert on encode calls.
+    """
+    _MOCK_BGE_MODEL.reset_mock()
+    _MOCK_BGE_MODEL.encode.return_value = _FAKE_EMBED
+
+    import app.services.embeddings as embeddings
+    monkeypatch.setattr(embeddings, "_get_bge_model", lambda: _MOCK_BGE_MODEL)
+    monkeypatch.setattr(embeddings.settings, "EMBEDDING_PROVIDER", "bge")
+    return _MOCK_BGE_MODEL
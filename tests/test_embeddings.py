@@ -12,75 +12,43 @@ class TestEmbeddingGeneration:
     """Test embedding generation with different providers."""
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_bge_basic(self):
+    async def test_generate_embedding_bge_basic(self, mock_bge_model):
         """Test basic BGE embedding generation."""
-        with patch('app.services.embeddings.settings') as mock_settings, \
-             patch('app.services.embeddings._get_bge_model') as mock_model_getter:
-
-            mock_settings.EMBEDDING_PROVIDER = "bge"
-
-            # Mock BGE model
-            mock_model = Mock()
-            mock_model.encode.return_value = Mock(tolist=lambda: [0.1] * 1024)
-            mock_model_getter.return_value = mock_model
-
-            result = await generate_embedding("test invoice text")
+        result = await generate_embedding("test invoice text")
 
-            assert isinstance(result, list)
-            assert len(result) == 1024
-            assert all(isinstance(x, float) for x in result)
+        assert isinstance(result, list)
+        assert len(result) == 1024
+        assert all(isinstance(x, float) for x in result)
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_with_query_prefix(self):
+    async def test_generate_embedding_with_query_prefix(self, mock_bge_model):
         """Test BGE embedding with query instruction prefix."""
-        with patch('app.services.embeddings.settings') as mock_settings, \
-             patch('app.services.embeddings._get_bge_model') as mock_model_getter:
-
-            mock_settings.EMBEDDING_PROVIDER = "bge"
-
-            mock_model = Mock()
-            mock_model.encode.return_value = Mock(tolist=lambda: [0.1] * 1024)
-            mock_model_getter.return_value = mock_model
-
-            # Generate with is_query=True
-            await generate_embedding("search query", is_query=True)
+        # Generate with is_query=True
+        await generate_embedding("search query", is_query=True)
 
-            # Verify the model was called with prefixed text
-            call_args = mock_model.encode.call_args[0][0]
-            assert call_args.startswith("Represent this sentence for searching relevant passages:")
-            assert "search query" in call_args
+        # Verify the model was called with prefixed text
+        call_args = mock_bge_model.encode.call_args[0][0]
+        assert call_args.startswith("Represent this sentence for searching relevant passages:")
+        assert "search query" in call_args
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_without_query_prefix(self):
+    async def test_generate_embedding_without_query_prefix(self, mock_bge_model):
         """Test BGE embedding without query prefix (document mode)."""
-        with patch('app.services.embeddings.settings') as mock_settings, \
-             patch('app.services.embeddings._get_bge_model') as mock_model_getter:
-
-            mock_settings.EMBEDDING_PROVIDER = "bge"
-
-            mock_model = Mock()
-            mock_model.encode.return_value = Mock(tolist=lambda: [0.1] * 1024)
-            mock_model_getter.return_value = mock_model
-
-            # Generate with is_query=False (default)
-            await generate_embedding("invoice document text", is_query=False)
+        # Generate with is_query=False (default)
+        await generate_embedding("invoice document text", is_query=False)
 
-            # Verify the model was called with original text (no prefix)
-            call_args = mock_model.encode.call_args[0][0]
-            assert call_args == "invoice document text"
-            assert not call_args.startswith("Represent this sentence")
+        # Verify the model was called with original text (no prefix)
+        call_args = mock_bge_model.encode.call_args[0][0]
+        assert call_args == "invoice document text"
+        assert not call_args.startswith("Represent this sentence")
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_bge_model_unavailable(self):
+    async def test_generate_embedding_bge_model_unavailable(self, mock_bge_model, monkeypatch):
         """Test error handling when BGE model is unavailable."""
-        with patch('app.services.embeddings.settings') as mock_settings, \
-             patch('app.services.embeddings._get_bge_model') as mock_model_getter:
+        monkeypatch.setattr('app.services.embeddings._get_bge_model', lambda: None)
 
-            mock_settings.EMBEDDING_PROVIDER = "bge"
-            mock_model_getter.return_value = None  # Model unavailable
-
-            with pytest.raises(Exception, match="BGE model not available"):
-                await generate_embedding("test text")
+        with pytest.raises(Exception, match="BGE model not available"):
+            await generate_embedding("test text")
 
     @pytest.mark.asyncio
     async def test_generate_embedding_openai(self):
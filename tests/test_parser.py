@@ -339,7 +339,12 @@ class TestPDFParser:
 
         # Verify database operations
         assert invoice_id == "test-invoice-id"
-        assert parser.db.add.call_count == 3  # 1 invoice + 2 line items
+        assert parser.db.add.call_count == 1  # the invoice row
+        # Line items go through one bulk insert instead of per-row adds
+        parser.db.bulk_insert_mappings.assert_called_once()
+        _, item_mappings = parser.db.bulk_insert_mappings.call_args[0]
+        assert len(item_mappings) == 2
+        assert {m["description"] for m in item_mappings} == {"Item 1", "Item 2"}
         parser.db.flush.assert_called_once()
         parser.db.commit.assert_called_once()
         parser.normalizer.update_vendor_stats.assert_called_once()